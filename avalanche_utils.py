@@ -12,7 +12,7 @@ import yaml
 import os
 from pathlib import Path
 from datetime import datetime
-from decimal import Decimal, getcontext
+from decimal import Decimal, localcontext
 from typing import Dict, Optional, Any, Union
 import pytz
 
@@ -82,7 +82,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         # Use print if logger not yet initialized
         try:
             logger.warning(f"Could not load config file {config_path}: {e}")
-        except:
+        except NameError:
             print(f"Warning: Could not load config file {config_path}: {e}")
         return {}
 
@@ -97,9 +97,9 @@ if _log_config:
     log_datefmt = _log_config.get('datefmt', '%Y-%m-%d %H:%M:%S')
     logging.basicConfig(level=log_level, format=log_format, datefmt=log_datefmt, force=True)
 
-# Set precision for decimal calculations (with config override support)
+# Precision for decimal calculations (with config override support). Applied in a
+# local context where Decimal arithmetic happens, not to the process-wide context.
 _precision = _config.get('decimal_precision', 50)
-getcontext().prec = _precision
 
 # Constants (with config override support)
 SNOWTRACE_API_BASE = _config.get('api', {}).get('snowtrace_base', "https://api.snowtrace.io/api")
@@ -447,7 +447,9 @@ def format_amount(amount: int, decimals: int, precision: str = 'auto') -> str:
         Formatted amount string with trailing zeros removed
     """
     divisor = 10 ** decimals
-    formatted = Decimal(amount) / Decimal(divisor)
+    with localcontext() as ctx:
+        ctx.prec = _precision
+        formatted = Decimal(amount) / Decimal(divisor)
     
     if precision == 'standard':
         return f"{formatted:.6f}".rstrip('0').rstrip('.')
@@ -18,13 +18,21 @@ import os
 import pickle
 import fcntl
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from decimal import Decimal, getcontext
+from typing import List, Dict, Iterator, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
 import argparse
+import atexit
+import base64
 import sys
+import threading
 import fnmatch
+import functools
+import heapq
+import importlib.util
+import traceback
+from html.parser import HTMLParser
+from urllib.parse import quote
 
 # Import logger and config loading from utils if available, otherwise create one
 try:
@@ -39,35 +47,704 @@ except ImportError:
     def load_config():
         return {}
 
-# Try to import selenium, fall back to requests + BeautifulSoup if not available
-try:
-    from selenium import webdriver
+# Selenium and BeautifulSoup take a couple of hundred milliseconds to import, so at
+# import time they are only looked up; _load_selenium/_load_bs4 import them on first
+# use. --help, cache hits and library use of Pool never pay for them.
+webdriver = Options = Service = By = WebDriverWait = EC = TimeoutException = WebDriverException = None
+BeautifulSoup = SoupStrainer = None
+lxml_html = _page_text_nodes = _table_row_name_cell = None
+
+SELENIUM_AVAILABLE = importlib.util.find_spec('selenium') is not None
+if not SELENIUM_AVAILABLE:
+    print("Warning: Selenium not available. Install with: pip install selenium")
+    print("This script requires Selenium to render the React app.")
+
+BS4_AVAILABLE = importlib.util.find_spec('bs4') is not None
+LXML_AVAILABLE = importlib.util.find_spec('lxml') is not None  # C parser backend for BeautifulSoup
+
+
+def _load_selenium() -> None:
+    """Import the Selenium names the scraper uses into module globals (once)"""
+    global webdriver, Options, Service, By, WebDriverWait, EC, TimeoutException, WebDriverException
+    if webdriver is not None:
+        return
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    SELENIUM_AVAILABLE = False
-    print("Warning: Selenium not available. Install with: pip install selenium")
-    print("This script requires Selenium to render the React app.")
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium import webdriver
+
+
+def _load_bs4() -> None:
+    """Import BeautifulSoup into module globals (once)"""
+    global BeautifulSoup, SoupStrainer
+    if BeautifulSoup is None:
+        from bs4 import BeautifulSoup, SoupStrainer
+
+
+def _load_lxml() -> None:
+    """Import lxml.html into module globals and compile the XPaths used with it (once)"""
+    global lxml_html, _page_text_nodes, _table_row_name_cell
+    if lxml_html is None:
+        from lxml import etree
+        _page_text_nodes = etree.XPath(_PAGE_TEXT_XPATH)
+        _table_row_name_cell = etree.XPath(_TABLE_ROW_NAME_CELL_XPATH)
+        from lxml import html as lxml_html
+
 
 try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    BS4_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# JSON decoder for scraped/API payloads: orjson is a C parser several times faster
+# than the stdlib and accepts both str and bytes
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps(obj, pretty: bool = True) -> str:
+    """
+    Serialize obj to a JSON string: 2-space indented if pretty, otherwise compact.
+    
+    Both backends write non-ASCII characters as-is (orjson always does, so the
+    stdlib path passes ensure_ascii=False). One difference remains: orjson
+    writes NaN and infinities as null, where json.dumps writes NaN/Infinity.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+# BeautifulSoup tree builder: lxml is several times faster than the pure-Python html.parser
+_HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
 
 # Version number (semantic versioning: MAJOR.MINOR.PATCH)
 __version__ = "1.3.2"
 
-# Set precision for decimal calculations (from config)
-_precision = _config.get('decimal_precision', 50)
-getcontext().prec = _precision
+# Top-level pool rows on the vote page (nested cells lack the even/odd class)
+_POOL_ROW_CSS = "div.liquidity-pool-cell.even, div.liquidity-pool-cell.odd"
+# Same rows by class substring, for markup where even/odd are not separate tokens
+_POOL_ROW_LOOSE_CSS = (
+    "div[class*='liquidity-pool-cell'][class*='even'],"
+    " div[class*='liquidity-pool-cell'][class*='odd']"
+)
+
+# CSS selectors for the parts of a pool row. Substring ([class*=...]) matches keep
+# the semantics of the XPath contains(@class, ...) tests they replaced, but are
+# matched by Blink's native selector engine instead of the XPath evaluator.
+_POOL_NAME_CSS = "div[class*='name']"
+_POOL_FEE_CSS = "div[class*='gas-info'] div[class*='text']"
+_POOL_LEFT_CSS = "div[class*='liquidity-pool-cell-left'], div[class*='liquidity-pool-cell-description']"
+_POOL_RIGHT_CSS = "div[class*='liquidity-pool-cell-right']"
+_POOL_SLOT_CSS = "div[class*='voting-pool-cell-slot']"
+_POOL_BUTTON_CSS = "[class*='liquidity-pool-cell-btn'], [class*='button'], button"
+_POOL_ID_ATTR_CSS = "[data-pool-id], [data-pool-address], [data-address]"
+_POOL_ADDRESS_TOOLTIP_CSS = "[data-tooltip-id*='address']"
+_POOLS_CONTAINER_CSS = "div[class*='pools-container'], div[class*='pool-section']"
+_PAGE_SIZE_CSS = "div[class*='size-per-page']"
+
+# The pools container element, or null; a querySelector never waits, unlike a
+# find_element miss, which blocks for the full implicit wait before raising
+_POOLS_CONTAINER_JS = f"return document.querySelector(\"{_POOLS_CONTAINER_CSS}\");"
+
+# outerHTML of just the pools container, a fraction of the full page_source
+_POOLS_CONTAINER_HTML_JS = (
+    f"var container = document.querySelector(\"{_POOLS_CONTAINER_CSS}\");"
+    " return container ? container.outerHTML : null;"
+)
+
+# The page's rendered text (what body .text returns) in one round-trip, without
+# first fetching the body as a WebElement
+_BODY_TEXT_JS = "return document.body ? document.body.innerText : '';"
+
+# innerText of the elements (or, with arguments[1], their parents) that have a text
+# node containing any of the lower-case needles in arguments[0], in document order.
+# One text-node walk in the page replaces a translate()-lowercasing XPath search
+# plus a .text round-trip per matching element.
+_ELEMENT_TEXTS_CONTAINING_JS = """
+const needles = arguments[0], useParent = arguments[1];
+const seen = new Set(), texts = [];
+const walker = document.createTreeWalker(document.body || document, NodeFilter.SHOW_TEXT);
+for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+    let el = node.parentElement;
+    if (!el || el.closest('script, style')) continue;
+    const value = node.nodeValue.toLowerCase();
+    if (!needles.some(needle => value.includes(needle))) continue;
+    if (useParent) el = el.parentElement || el;
+    if (seen.has(el)) continue;
+    seen.add(el);
+    texts.push((el.innerText || '').trim());
+}
+return texts;
+"""
+
+# Nearest page-size option container for a "100" label (replaces an ancestor:: XPath)
+_SIZE_CONTAINER_JS = "return arguments[0].closest(\"[class*='size-container']\");"
+
+# Counts rendered pool rows in one round-trip (an int) instead of serializing
+# every row as a WebElement just to take len() of the result
+_POOL_COUNT_JS = f"return document.querySelectorAll('{_POOL_ROW_CSS}').length;"
+
+# Finds the control that opens page arguments[0] in one round-trip, instead of
+# several XPath searches plus a class/disabled/displayed/text call per candidate.
+# In order: an enabled, visible "Next"/arrow button (anything looking like a
+# previous-page control is skipped), a button labelled with the page number,
+# then any clickable element with that number in the pagination footer.
+# Returns the element to click, or null on the last page.
+_FIND_NEXT_PAGE_JS = """
+const nextPage = String(arguments[0]);
+const lower = value => (value || '').toLowerCase();
+const label = el => (el.innerText || el.textContent || '').trim();
+const usable = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length) &&
+    !el.hasAttribute('disabled') && el.getAttribute('aria-disabled') !== 'true' &&
+    !lower(el.getAttribute('class')).includes('disabled');
+const inPagination = el => !!el.closest("[class*='pagination']");
+
+for (const btn of document.querySelectorAll("button, [role='button']")) {
+    const classes = lower(btn.getAttribute('class'));
+    const ariaLabel = lower(btn.getAttribute('aria-label'));
+    const text = label(btn);
+    const isButton = btn.tagName === 'BUTTON';
+    const candidate = isButton
+        ? text.includes('Next') || ariaLabel.includes('next') || classes.includes('next') ||
+          classes.includes('arrow') || (inPagination(btn) && (text.includes('>') || text.includes('?')))
+        : classes.includes('next') || ariaLabel.includes('next');
+    if (!candidate || !usable(btn)) continue;
+    if (classes.includes('prev') || lower(text).includes('prev') || text.includes('<') || text.includes('?')) continue;
+    if (text.includes('>') || classes.includes('next') || ariaLabel.includes('next')) return btn;
+}
+
+for (const btn of document.querySelectorAll("button, [role='button']")) {
+    if (btn.textContent.trim() === nextPage && usable(btn)) return btn;
+}
+
+const footer = "[class*='pagination'] *, [class*='page-result-section'] *, [class*='footer'] *";
+for (const el of document.querySelectorAll(footer)) {
+    if (label(el) !== nextPage || !usable(el)) continue;
+    const classes = lower(el.getAttribute('class'));
+    const clickable = ['BUTTON', 'DIV'].includes(el.tagName) || classes.includes('clickable') ||
+        classes.includes('page') || lower(el.getAttribute('style')).includes('cursor:pointer') ||
+        el.hasAttribute('onclick') || inPagination(el);
+    if (clickable) return el;
+}
+return null;
+"""
+
+# Every top-level pool row with its pool name, as [row, name] pairs, in one round-trip.
+# Falls back to the class-substring row selector when the exact one finds nothing,
+# as fetch_pools_selenium does.
+_POOL_ROW_NAMES_JS = f"""
+let rows = document.querySelectorAll({json.dumps(_POOL_ROW_CSS)});
+if (!rows.length) rows = document.querySelectorAll({json.dumps(_POOL_ROW_LOOSE_CSS)});
+return Array.from(rows, row => {{
+    const name = row.querySelector({json.dumps(_POOL_NAME_CSS)});
+    return [row, name ? name.innerText.trim() : ''];
+}});
+"""
+
+# Selects one pool row (arguments[0]) for voting: ticks its checkbox, else clicks a
+# select control, else the left section, else the row itself. Returns 'already'
+# (checkbox was ticked), 'selected', 'clicked' (a plain click that needs a moment
+# to register) or null if nothing could be clicked.
+_SELECT_POOL_ROW_JS = """
+const row = arguments[0];
+const checkbox = row.querySelector("input[type='checkbox']");
+if (checkbox) {
+    if (checkbox.checked) return 'already';
+    checkbox.click();
+    return 'selected';
+}
+const button = row.querySelector(
+    "div[class*='checkbox'], div[class*='select'], button[class*='select'], div[role='checkbox']");
+if (button) {
+    button.click();
+    return 'selected';
+}
+const left = row.querySelector("div[class*='liquidity-pool-cell-left']");
+try {
+    (left || row).click();
+    return 'clicked';
+} catch (e) {
+    return null;
+}
+"""
+
+# Scrolls the pools container (arguments[0], or the window when null) to the bottom
+# and calls back with the row count once lazy loading has gone quiet: no DOM
+# additions for arguments[2] ms after the last one, or arguments[1] ms if none
+# arrive at all, never longer than arguments[3] ms. Run with execute_async_script.
+_SCROLL_AND_AWAIT_ROWS_JS = f"""
+const container = arguments[0], firstMs = arguments[1], quietMs = arguments[2], maxMs = arguments[3];
+const done = arguments[arguments.length - 1];
+let timer, cap;
+const finish = () => {{
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(cap);
+    done(document.querySelectorAll({json.dumps(_POOL_ROW_CSS)}).length);
+}};
+const observer = new MutationObserver(records => {{
+    if (records.some(record => record.addedNodes.length)) {{
+        clearTimeout(timer);
+        timer = setTimeout(finish, quietMs);
+    }}
+}});
+observer.observe(container || document.body, {{childList: true, subtree: true}});
+timer = setTimeout(finish, firstMs);
+cap = setTimeout(finish, maxMs);
+if (container) {{
+    container.scrollTop = container.scrollHeight;
+}} else {{
+    window.scrollTo(0, document.body.scrollHeight);
+}}
+"""
+
+# Text of the first pool row, used to detect when a re-sort has re-rendered the list
+_FIRST_POOL_TEXT_JS = (
+    f"var row = document.querySelector('{_POOL_ROW_CSS}');"
+    " return row ? row.innerText : null;"
+)
+
+# Harvests every field the row parser needs from a list of pool rows (arguments[0],
+# or every _POOL_ROW_CSS row on the page when no list is passed) in one round-trip,
+# instead of a find_elements/.text/get_attribute call per field.
+# Returns one plain object per row; _parse_pool_row turns it into a Pool.
+_HARVEST_POOL_ROWS_JS = f"""
+const text = el => (el && el.innerText || '').trim();
+// First pool address in the row's descendant attribute values, then its text; avoids
+// serializing the whole subtree through innerHTML just to regex-scan it
+const addressIn = row => {{
+    for (const el of row.querySelectorAll('*')) {{
+        for (const attr of el.attributes) {{
+            const match = attr.value.match(/0x[a-fA-F0-9]{{40}}/);
+            if (match) return match[0];
+        }}
+    }}
+    const match = (row.textContent || '').match(/0x[a-fA-F0-9]{{40}}/);
+    return match ? match[0] : null;
+}};
+const rows = arguments[0] || document.querySelectorAll({json.dumps(_POOL_ROW_CSS)});
+return Array.from(rows, row => {{
+    const right = row.querySelector({json.dumps(_POOL_RIGHT_CSS)});
+    const idElement = row.querySelector({json.dumps(_POOL_ID_ATTR_CSS)});
+    const tooltip = row.querySelector({json.dumps(_POOL_ADDRESS_TOOLTIP_CSS)});
+    const name = text(row.querySelector({json.dumps(_POOL_NAME_CSS)}));
+    return {{
+        text: text(row),
+        classes: row.getAttribute('class') || '',
+        style: row.getAttribute('style') || '',
+        opacity: getComputedStyle(row).opacity,
+        buttons: Array.from(row.querySelectorAll({json.dumps(_POOL_BUTTON_CSS)})).slice(0, 3).map(btn => [
+            btn.getAttribute('data-tooltip-id') || '',
+            btn.getAttribute('data-tooltip-content') || btn.getAttribute('title') || ''
+        ]),
+        name: name,
+        // Only the name fallback reads the left section; skip its innerText otherwise
+        left: name ? '' : text(row.querySelector({json.dumps(_POOL_LEFT_CSS)})),
+        fee: text(row.querySelector({json.dumps(_POOL_FEE_CSS)})),
+        pool_id: row.getAttribute('data-pool-id') || row.getAttribute('data-pool-address') ||
+                 row.getAttribute('data-address') || row.getAttribute('data-id') ||
+                 (idElement && (idElement.getAttribute('data-pool-id') ||
+                                idElement.getAttribute('data-pool-address') ||
+                                idElement.getAttribute('data-address'))) ||
+                 addressIn(row),
+        tooltip_id: tooltip ? tooltip.getAttribute('data-tooltip-id') : null,
+        slots: right ? Array.from(right.querySelectorAll({json.dumps(_POOL_SLOT_CSS)}), text) : []
+    }};
+}});
+"""
+
+# Static assets and third-party trackers the scraper never reads; blocked via CDP
+# when selenium.block_resources is on. Stylesheets are deliberately not blocked:
+# element .text and the opacity-based disabled-pool check depend on computed styles.
+_BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*hotjar.com*', '*segment.io*', '*mixpanel.com*',
+]
+
+# Pool name forms, most specific first: "CL200-WAVAX/USDC" or "CL200-WETH.e/USDt",
+# then "WAVAX/USDC". lastindex tells which matched.
+_RE_POOL_NAME = re.compile(r'([A-Z0-9\-]+-[A-Z0-9\.]+/[A-Z0-9\.]+)|([A-Z0-9\.]+/[A-Z0-9\.]+)')
+
+# Patterns used per row/line by the DOM, HTML and text extractors
+_RE_DOLLAR = re.compile(r'\$[\d,]+\.?\d*')
+_RE_VAPR = re.compile(r'([\d,]+\.?\d*)\s*%')
+_RE_PAIR = re.compile(r'([A-Z0-9\.]+/[A-Z0-9\.]+)')
+# Pair, dollar amount and percentage in one pass for the text line scanner
+_RE_LINE = re.compile(
+    r'(?P<pair>[A-Z0-9\.]+/[A-Z0-9\.]+)'
+    r'|\$(?P<dollars>[\d,]+\.?\d*)'
+    r'|(?P<pct>[\d,]+\.?\d*)\s*%'
+)
+_RE_PAIR_OR_TOKEN = re.compile(r'([A-Z0-9\.]+/[A-Z0-9\.]+|[A-Z]{2,})')
+_RE_MILLIONS = re.compile(r'([\d,]+\.?\d*)\s*[Mm]')  # "31.29M" at the start of a votes slot
+_RE_VOTES_M = re.compile(r'([\d,]+\.?\d*)\s*[Mm]\b')  # same, anywhere in full row text
+_RE_NUM = re.compile(r'\b([\d,]+)\b')
+# Plain vote counts (1,000 - 999,999): grouped thousands or 4-6 bare digits
+_RE_VOTE_COUNT = re.compile(r'\b(\d{1,3}(?:,\d{3})+|\d{4,6})\b')
+_RE_POOL_CLASS = re.compile(r'pool|row|card|item', re.I)  # SoupStrainer for pool cards
+# SoupStrainer for vote page rows; while strained parsing runs, the class
+# attribute is still one unsplit string, so a plain class_='...' never matches it
+_RE_POOL_ROW_CLASS = re.compile(r'(?:^|\s)liquidity-pool-cell(?:\s|$)')
+
+# HTML fallback (Strategy 2): pool cards and the name element inside a card.
+# Case-insensitive substring matches on the class attribute, like _RE_POOL_CLASS.
+_POOL_CARD_CSS = ", ".join(
+    f'{tag}[class*="{word}" i]' for tag in ('div', 'section') for word in ('pool', 'row', 'card', 'item')
+)
+_POOL_CARD_NAME_CSS = '[class*="name" i], [class*="token" i], [class*="pair" i]'
+
+# Embedded JSON that may carry pool data. Every '"pools"' key is found with one
+# literal scan, and state blobs by their assignment; the JSON around them is
+# then cut out with a bracket-balanced scan (lazy .*? regexes stop at the first
+# nested '}' or ']', and '\{.*?"pools"' rescans the page from every '{').
+_JSON_POOLS_KEY = '"pools"'
+_JSON_STATE_SENTINELS = ('window.__INITIAL_STATE__', 'window.__APOLLO_STATE__')
+_RE_JSON_ASSIGN = re.compile(r'\s*=\s*')
+_RE_JSON_POOLS_ARRAY = re.compile(r'"pools"\s*:\s*(?=\[)')
+_RE_JSON_STRUCTURAL = re.compile(r'[{}\[\]"\\]')
+
+# How long _get_page_text reuses the text it read for an unchanged URL
+_PAGE_TEXT_CACHE_SECONDS = 5.0
+
+# Epoch countdown and deadline patterns (_extract_epoch_info)
+_RE_COUNTDOWN_COMPACT = re.compile(r'(\d+)d\s*:\s*(\d+)h\s*:\s*(\d+)m\s*:\s*(\d+)s', re.IGNORECASE)  # 02d:08h:38m:35s
+_RE_CLOCK = re.compile(r'(\d{1,2}):(\d{2}):(\d{2})')  # HH:MM:SS
+# "2d 8h", "2 days 8 hours" ... every unit in one pattern, short or long unit names
+_RE_DURATION_ABBR = re.compile(r'(\d+)\s*(d(?:ays?)?|h(?:ours?)?|m(?:inutes?)?|s(?:econds?)?)\b', re.IGNORECASE)
+# "2 days 8 hours ..." with spelled-out units only
+_RE_DURATION = re.compile(r'(\d+)\s*(day|hour|minute|second)', re.IGNORECASE)
+_RE_DAY_OR_HOUR = re.compile(r'\d+\s*(day|hour)', re.IGNORECASE)
+_RE_DAY_HOUR_OR_MINUTE = re.compile(r'\d+\s*(day|hour|minute)', re.IGNORECASE)
+_RE_DAYS_HOURS = re.compile(r'(\d+)\s*d(?:ays?|\.)?[\s,]*(\d+)\s*h(?:ours?|\.)?', re.IGNORECASE)
+# "Voting deadline for epoch #<number>" and the text after it, strictest first
+_RE_DEADLINE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL) for pattern in (
+    r'Voting\s+deadline\s+for\s+epoch\s*#\s*(\d+)[\s\n:]*([^\n]{0,200})',  # Flexible spacing and colon
+    r'Voting\s+deadline\s+for\s+epoch\s*#\s*(\d+)[\s\n]*([^\n]{0,200})',  # Without colon
+    r'Voting\s+deadline.*?epoch\s*#\s*(\d+)[\s\n:]*([^\n]{0,200})',  # More flexible
+    r'deadline.*?epoch\s*#\s*(\d+)[\s\n:]*([^\n]{0,200})',  # Without "Voting"
+))
+# UTC timestamps as the page lists them, with or without seconds, as numeric groups
+_RE_UTC_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})(?::(\d{2}))?\s+UTC')
+
+# Text nodes of a parsed page, skipping script and style bodies
+_PAGE_TEXT_XPATH = '//text()[not(ancestor::script or ancestor::style)]'
+# First cell-like descendant of a table row (where the pool name usually is)
+_TABLE_ROW_NAME_CELL_XPATH = '(.//td | .//th | .//div | .//span)[1]'
+
+# Voting script / bookmarklet generation: pool data embedded in the generated JS,
+# and the comment and whitespace squeezing applied before URL-encoding it
+_RE_JS_POOL_ADDRESSES = re.compile(r'const poolAddresses = (\[.*?\]);', re.DOTALL)
+_RE_JS_POOL_INFO = re.compile(r'const poolInfo = (\{.*?\});', re.DOTALL)
+_RE_JS_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_RE_WHITESPACE_RUN = re.compile(r'\s+')
+
+# Human-readable names for pool types in the detailed output
+_TYPE_NAME_MAP = {
+    'CL200': 'Concentrated Liquidity, 200x',
+    'CL1': 'Concentrated Liquidity, 1x',
+    'vAMM': 'Virtual AMM'
+}
 
+# CL pool fee tier (hundredths of a basis point, as cl-pools.json lists it) -> (pool type, fee label)
+_CL_FEE_TIERS = {
+    100: ('CL1', '0.01%'),
+    500: ('CL200', '0.05%'),
+    2500: ('CL200', '0.25%'),
+    5000: ('CL200', '0.5%'),
+    7000: ('CL200', '0.7%'),
+    10000: ('CL200', '1%'),
+}
 
-@dataclass
+# Characters stripped from scraped amounts ("$1,234.5", "~$80") before float()
+_NUMBER_STRIP_TABLE = str.maketrans('', '', '$,~')
+
+# Class-name fragments that mark a pool row as disabled/inactive (won't pay rewards)
+_DISABLED_CLASS_MARKERS = ('disabled', 'inactive', 'no-reward', 'paused', 'gray', 'grey')
+# Rewards-slot text meaning "no rewards"
+_ZERO_REWARD_MARKERS = ('$0', '$0.00', '$0,000', '--', '?', 'no reward', 'n/a')
+_RE_OPACITY = re.compile(r'opacity\s*:\s*([\d.]+)')
+_RE_ETH_ADDRESS = re.compile(r'0x[a-fA-F0-9]{40}')
+
+# Profitability score scales: the value that earns full marks for each metric
+_SCORE_REWARDS_FULL = 10000.0  # $10k total rewards = 100 points
+_SCORE_REWARDS_PER_VOTE_FULL = 0.5  # $0.50 per vote = 100 points (square-root curve)
+_SCORE_VAPR_CAP = 1000.0  # VAPR above 1000% scores no higher
+# Multipliers used in place of dividing by the scales above
+_INV_SCORE_REWARDS_FULL = 1.0 / _SCORE_REWARDS_FULL
+_INV_SCORE_REWARDS_PER_VOTE_FULL = 1.0 / _SCORE_REWARDS_PER_VOTE_FULL
+_INV_SCORE_VAPR_CAP = 1.0 / _SCORE_VAPR_CAP
+# Weights of rewards per vote, total rewards and VAPR in the combined score
+_SCORE_WEIGHT_REWARDS_PER_VOTE = 0.6
+_SCORE_WEIGHT_TOTAL_REWARDS = 0.25
+_SCORE_WEIGHT_VAPR = 0.15
+
+
+def _parse_duration(text: str, pattern: re.Pattern = _RE_DURATION) -> timedelta:
+    """
+    Sum the days, hours, minutes and seconds in a countdown such as "2 days 8 hours".
+    
+    pattern (_RE_DURATION or _RE_DURATION_ABBR) captures an amount and a unit; the
+    text is scanned once and the first amount seen for each unit is used.
+    """
+    amounts = {}
+    for match in pattern.finditer(text):
+        amounts.setdefault(match.group(2)[0].lower(), int(match.group(1)))
+    return timedelta(days=amounts.get('d', 0), hours=amounts.get('h', 0),
+                     minutes=amounts.get('m', 0), seconds=amounts.get('s', 0))
+
+
+class _TextCollector(HTMLParser):
+    """Collect the text nodes of an HTML document, skipping script and style bodies"""
+    
+    _SKIP_TAGS = frozenset(('script', 'style'))
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.chunks: List[str] = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+    
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+    
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.chunks.append(data)
+
+
+def _html_to_text(page_source: str) -> str:
+    """
+    Newline-separated text of an HTML document, without script and style bodies.
+    
+    Uses lxml.html (C parser, text nodes picked by XPath) when installed, then
+    BeautifulSoup, then a single streaming pass of the stdlib HTMLParser.
+    """
+    if not page_source:
+        return ''
+    if LXML_AVAILABLE:
+        _load_lxml()
+        return '\n'.join(_page_text_nodes(lxml_html.fromstring(page_source)))
+    if BS4_AVAILABLE:
+        _load_bs4()
+        soup = BeautifulSoup(page_source, _HTML_PARSER)
+        for element in soup(['script', 'style']):
+            element.decompose()
+        return soup.get_text(separator='\n')
+    collector = _TextCollector()
+    collector.feed(page_source)
+    collector.close()
+    return '\n'.join(collector.chunks)
+
+
+def _scan_json_object(text: str, start: int) -> Optional[str]:
+    """
+    Return the bracket-balanced JSON object (or array) that opens at text[start].
+    
+    Jumps between structural characters with a compiled regex, so the scan is
+    linear in the length of the value and never backtracks.
+    
+    Args:
+        text: Text containing the value
+        start: Index of the opening '{' or '['
+    
+    Returns:
+        The value's source text, or None if it is never closed
+    """
+    depth = 0
+    in_string = False
+    escaped_index = -1
+    for match in _RE_JSON_STRUCTURAL.finditer(text, start):
+        i = match.start()
+        if i == escaped_index:
+            continue
+        char = text[i]
+        if in_string:
+            if char == '\\':
+                escaped_index = i + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '{[':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _enclosing_json_object(text: str, index: int) -> Optional[str]:
+    """Return the innermost balanced {...} in text that spans text[index], if any"""
+    start = text.rfind('{', 0, index)
+    while start != -1:
+        blob = _scan_json_object(text, start)
+        if blob is None:
+            return None
+        if start + len(blob) > index:
+            return blob
+        # That object closed before index (a sibling); try the next '{' out
+        start = text.rfind('{', 0, start)
+    return None
+
+
+def _iter_lines(text: str):
+    """
+    Yield the lines of text one at a time.
+    
+    Unlike text.split('\n') this never holds a list of every line, and unlike
+    io.StringIO it does not copy the page into a second (UCS-4) buffer.
+    """
+    start = 0
+    find = text.find
+    while True:
+        end = find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _iter_json_candidates(text: str):
+    """
+    Yield JSON snippets embedded in page text that may contain pool data.
+    
+    Literal markers are located with str.find/in (memchr-speed) before any
+    regex runs, so pages without embedded JSON are rejected almost for free.
+    """
+    key_index = text.find(_JSON_POOLS_KEY)
+    while key_index != -1:
+        # The innermost object that contains the key...
+        blob = _enclosing_json_object(text, key_index)
+        if blob:
+            yield blob
+        # ...and the bare '"pools": [...]' member, wrapped into an object
+        member = _RE_JSON_POOLS_ARRAY.match(text, key_index)
+        if member:
+            array = _scan_json_object(text, member.end())
+            if array:
+                yield '{"pools": ' + array + '}'
+        key_index = text.find(_JSON_POOLS_KEY, key_index + len(_JSON_POOLS_KEY))
+    for sentinel in _JSON_STATE_SENTINELS:
+        index = text.find(sentinel)
+        while index != -1:
+            assign = _RE_JSON_ASSIGN.match(text, index + len(sentinel))
+            if assign and text.startswith('{', assign.end()):
+                blob = _scan_json_object(text, assign.end())
+                if blob:
+                    yield blob
+            index = text.find(sentinel, index + len(sentinel))
+
+
+def _parse_number(text: str) -> float:
+    """Parse a scraped amount such as '$1,234.56' or '6,967' in a single pass."""
+    return float(text.translate(_NUMBER_STRIP_TABLE))
+
+
+def _find_address_in_soup(element) -> Optional[str]:
+    """
+    First 0x address in the attribute values of element's descendants, then in its
+    text - the same places an innerHTML scan would find one, without re-serializing
+    the subtree to markup first.
+    """
+    for child in element.find_all(True):
+        for value in child.attrs.values():
+            if isinstance(value, list):  # multi-valued attributes such as class
+                value = ' '.join(value)
+            address_match = _RE_ETH_ADDRESS.search(value)
+            if address_match:
+                return address_match.group(0)
+    address_match = _RE_ETH_ADDRESS.search(element.get_text())
+    return address_match.group(0) if address_match else None
+
+
+def _parse_rewards_slot(slot_text: str) -> Optional[float]:
+    """
+    Read total rewards from a "Fees + Incentives" slot.
+    
+    Returns 0.0 for empty/'--'/$0 markers and None if the slot has no dollar amount.
+    """
+    if not slot_text or slot_text == '--' or any(marker in slot_text for marker in _ZERO_REWARD_MARKERS):
+        return 0.0
+    rewards_match = _RE_DOLLAR.search(slot_text)
+    return _parse_number(rewards_match.group(0)) if rewards_match else None
+
+
+def _parse_votes_line(line: str) -> Optional[float]:
+    """Read a vote count ("31.29M" or "544,767") from the first line of a votes slot"""
+    votes_match = _RE_MILLIONS.search(line)
+    if votes_match:
+        return _parse_number(votes_match.group(1)) * 1_000_000
+    # Numbers without M: votes are typically >= 1000
+    for num_str in _RE_NUM.findall(line):
+        num_val = _parse_number(num_str)
+        if num_val >= 1000:
+            return num_val
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _score_kernel(total_rewards: float, vapr: float,
+                  current_votes: Optional[float]) -> float:
+    """
+    Compute a pool's profitability score from its raw metrics in a single pass.
+    
+    A free function over plain floats, with no attribute lookups. Results are
+    memoized (lru_cache, up to 4096 entries) keyed on those floats rather than
+    on the mutable Pool. The saving is small: a cache hit is a fraction of a
+    microsecond against about a microsecond for an uncached score, and a pool
+    is scored only about three times (ranked, printed, written as JSON).
+    
+    Args:
+        total_rewards: Total pool rewards in USD
+        vapr: VAPR percentage
+        current_votes: Current votes in the pool, or None if unknown
+    
+    Returns:
+        Weighted score (higher is better)
+    """
+    # Normalize total rewards (secondary - absolute size matters too)
+    rewards_total_normalized = min(total_rewards * _INV_SCORE_REWARDS_FULL, 1.0) * 100
+    
+    # Normalize rewards per vote (primary metric, accounts for dilution)
+    # Scale: $0.50 per vote = 100 points, using square root for gentler curve
+    # This handles wide range: $0.001 to $0.50 per vote
+    if current_votes is not None and current_votes > 0:
+        rewards_per_vote = total_rewards / current_votes
+        if rewards_per_vote > 0:
+            rewards_per_vote_normalized = min(100, (rewards_per_vote * _INV_SCORE_REWARDS_PER_VOTE_FULL) ** 0.5 * 100)
+        else:
+            rewards_per_vote_normalized = 0
+    else:
+        # Fallback: if no vote data, use total rewards (less accurate)
+        rewards_per_vote_normalized = rewards_total_normalized
+    
+    # Normalize VAPR (tertiary)
+    vapr_normalized = min(vapr * _INV_SCORE_VAPR_CAP, 1.0) * 100  # Cap at 1000% for normalization
+    
+    # Weighted combination:
+    # - Rewards per vote: 60% (most important - accounts for dilution)
+    # - Total rewards: 25% (absolute size still matters)
+    # - VAPR: 15% (return percentage)
+    return (rewards_per_vote_normalized * _SCORE_WEIGHT_REWARDS_PER_VOTE
+            + rewards_total_normalized * _SCORE_WEIGHT_TOTAL_REWARDS
+            + vapr_normalized * _SCORE_WEIGHT_VAPR)
+
+
+@dataclass(slots=True)
 class Pool:
     """Represents a liquidity pool with its metrics"""
     name: str
@@ -86,37 +763,7 @@ class Pool:
         - Total rewards (absolute size) - SECONDARY  
         - VAPR (return percentage) - TERTIARY
         """
-        # Calculate rewards per vote if we have vote data
-        rewards_per_vote = None
-        if self.current_votes is not None and self.current_votes > 0:
-            rewards_per_vote = self.total_rewards / self.current_votes
-        
-        # Normalize rewards per vote (primary metric, accounts for dilution)
-        # Scale: assume max around $0.50 per vote is excellent, using square root for better distribution
-        if rewards_per_vote is not None:
-            if rewards_per_vote > 0:
-                # Normalize: $0.50 per vote = 100 points, using square root for gentler curve
-                # This handles wide range: $0.001 to $0.50 per vote
-                normalized = min(100, max(0, (rewards_per_vote / 0.5) ** 0.5 * 100))
-                rewards_per_vote_normalized = normalized
-            else:
-                rewards_per_vote_normalized = 0
-        else:
-            # Fallback: if no vote data, use total rewards (less accurate)
-            rewards_per_vote_normalized = min(self.total_rewards / 10000.0, 1.0) * 100
-        
-        # Normalize total rewards (secondary - absolute size matters too)
-        rewards_total_normalized = min(self.total_rewards / 10000.0, 1.0) * 100
-        
-        # Normalize VAPR (tertiary)
-        vapr_normalized = min(self.vapr / 100.0, 10.0) * 10  # Cap at 1000% for normalization
-        
-        # Weighted combination:
-        # - Rewards per vote: 60% (most important - accounts for dilution)
-        # - Total rewards: 25% (absolute size still matters)
-        # - VAPR: 15% (return percentage)
-        score = (rewards_per_vote_normalized * 0.6) + (rewards_total_normalized * 0.25) + (vapr_normalized * 0.15)
-        return score
+        return _score_kernel(self.total_rewards, self.vapr, self.current_votes)
     
     def estimate_user_rewards(self, user_voting_power: float) -> float:
         """
@@ -139,7 +786,14 @@ class Pool:
 
 
 class BlackholePoolRecommender:
-    def __init__(self, headless: Optional[bool] = None, no_cache: bool = False):
+    # Scraping browser shared by every instance in the process (see _get_scrape_driver).
+    # Keyed by the options it was launched with; quit at interpreter exit.
+    _shared_driver = None
+    _shared_driver_key = None
+    _shared_driver_lock = threading.Lock()
+    
+    def __init__(self, headless: Optional[bool] = None, no_cache: bool = False,
+                 cache_expiry_minutes: Optional[int] = None):
         self.url = "https://blackhole.xyz/vote"
         # Use config value if headless not explicitly provided
         _pool_config = _config.get('pool_recommender', {})
@@ -148,17 +802,30 @@ class BlackholePoolRecommender:
             self.headless = _selenium_config.get('headless', True)
         else:
             self.headless = headless
-        self.implicit_wait = _selenium_config.get('implicit_wait', 10)
+        # Seconds to wait for optional page controls (page-size dropdown, sort header).
+        # The driver's own implicit wait stays at 0 so a lookup that finds nothing
+        # returns at once; waits are explicit, via WebDriverWait, where needed.
+        self.implicit_wait = _selenium_config.get('implicit_wait', 5)
+        # Skip downloading images and web fonts while scraping (text is all we read)
+        self.block_resources = _selenium_config.get('block_resources', True)
         self.pools: List[Pool] = []
         self.epoch_close_utc: Optional[datetime] = None
         self.epoch_close_local: Optional[datetime] = None
+        # (url, monotonic time, text) of the last page text read by _get_page_text
+        self._page_text_cache: Optional[Tuple[str, float, str]] = None
         
         # Cache configuration
         _cache_config = _pool_config.get('cache', {})
         # If no_cache is True, disable cache reading (but still allow writing to refresh cache)
         self.no_cache = no_cache
         self.cache_enabled = _cache_config.get('enabled', True) and not no_cache
-        self.cache_expiry_minutes = _cache_config.get('expiry_minutes', 60)  # Default: 1 hour
+        # Configured expiry; this is what gets recorded with the cache
+        self.configured_cache_expiry_minutes = _cache_config.get('expiry_minutes', 60)  # Default: 1 hour
+        # Explicit expiry (e.g. from --cache-ttl) overrides the config value for this run only
+        if cache_expiry_minutes is None:
+            self.cache_expiry_minutes = self.configured_cache_expiry_minutes
+        else:
+            self.cache_expiry_minutes = cache_expiry_minutes
         cache_dir = _cache_config.get('directory', 'cache')
         # Get project root (directory containing this script)
         project_root = Path(__file__).parent
@@ -166,6 +833,13 @@ class BlackholePoolRecommender:
         self.cache_file = self.cache_dir / 'pool_data_cache.pkl'
         self.cache_metadata_file = self.cache_dir / 'pool_data_cache_metadata.json'
         self.cache_lock_file = self.cache_dir / 'pool_data_cache.lock'
+        
+        # Shared HTTP session so API requests reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
+            'Accept': 'application/json'
+        })
     
     def _ensure_cache_dir(self) -> None:
         """Ensure cache directory exists"""
@@ -275,7 +949,9 @@ class BlackholePoolRecommender:
             if cache_timestamp.tzinfo is None:
                 cache_timestamp = cache_timestamp.replace(tzinfo=timezone.utc)
             
-            expiry_minutes = metadata.get('expiry_minutes', self.cache_expiry_minutes)
+            # The expiry in effect for this run (same as _is_cache_valid), not the one
+            # recorded when the cache was written
+            expiry_minutes = self.cache_expiry_minutes
             expiry_time = cache_timestamp + timedelta(minutes=expiry_minutes)
             now = datetime.now(timezone.utc)
             
@@ -313,8 +989,9 @@ class BlackholePoolRecommender:
                         if lock_file:
                             fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
                             lock_file.close()
-                except (pickle.UnpicklingError, OSError, KeyError) as e:
+                except (pickle.UnpicklingError, OSError, KeyError, AttributeError) as e:
                     # If we can't load the cache, it's invalid
+                    # (AttributeError: pickled by an older Pool layout)
                     content_valid = False
                     validation_issues.append(f"error loading cache: {e}")
             
@@ -366,7 +1043,8 @@ class BlackholePoolRecommender:
                 if lock_file:
                     fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
                     lock_file.close()
-        except (pickle.UnpicklingError, OSError, KeyError) as e:
+        except (pickle.UnpicklingError, OSError, KeyError, AttributeError) as e:
+            # AttributeError: cache was pickled by an older Pool layout; treat as a miss
             logger.warning(f"Error loading from cache: {e}")
             return None
     
@@ -492,7 +1170,8 @@ class BlackholePoolRecommender:
                 metadata = {
                     'timestamp': datetime.now(timezone.utc).isoformat(),
                     'pool_count': len(pools),
-                    'expiry_minutes': self.cache_expiry_minutes
+                    # The configured expiry: a one-off --cache-ttl applies to this run only
+                    'expiry_minutes': self.configured_cache_expiry_minutes
                 }
                 with open(temp_metadata_file, 'w') as f:
                     json.dump(metadata, f, indent=2)
@@ -519,24 +1198,13 @@ class BlackholePoolRecommender:
         """Fetch pool data using Selenium (most reliable for React apps)"""
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium is required. Install with: pip install selenium")
-        
-        options = Options()
-        if self.headless:
-            options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        # Add timeout settings to prevent hangs
-        options.add_argument('--page-load-strategy=eager')  # Don't wait for all resources
+        _load_selenium()
         
         driver = None
+        scrape_failed = False
         try:
-            # Set service with timeout to prevent connection hangs
-            service = Service()
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.implicitly_wait(self.implicit_wait)
+            driver = self._get_scrape_driver()
+            driver.implicitly_wait(0)
             # Set page load timeout to prevent indefinite hangs
             driver.set_page_load_timeout(60)  # 60 seconds max for page loads
             if not quiet:
@@ -546,7 +1214,13 @@ class BlackholePoolRecommender:
             if not quiet:
                 print("Waiting for pool data to load (this may take 15-20 seconds)...")
             try:
-                time.sleep(12)  # Give React time to render and fetch data
+                # Wait for React to render the first pool rows rather than a fixed delay
+                WebDriverWait(driver, 25).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _POOL_ROW_CSS))
+                )
+            except TimeoutException:
+                if not quiet:
+                    logger.warning("Timed out waiting for pool rows to render, continuing anyway")
             except KeyboardInterrupt:
                 if not quiet:
                     print("\nInterrupted - attempting to extract available data...")
@@ -557,16 +1231,16 @@ class BlackholePoolRecommender:
                 print("Setting pagination to 100 pools per page...")
             try:
                 # Find the pagination container (custom dropdown) - use find_elements with WebDriverWait
-                pagination_containers = WebDriverWait(driver, 5).until(
-                    EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'size-per-page')]"))
+                pagination_containers = WebDriverWait(driver, self.implicit_wait).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, _PAGE_SIZE_CSS))
                 )
                 if pagination_containers:
                     pagination_container = pagination_containers[0]
                     # Click on the container to open dropdown
                     driver.execute_script("arguments[0].click();", pagination_container)
-                    time.sleep(1.5)  # Wait for dropdown to open
                     
                     # Look for option with text "100" - it's in a span with class "size-text"
+                    # (the wait below also covers the dropdown opening)
                     try:
                         option_100s = WebDriverWait(driver, 3).until(
                             EC.presence_of_all_elements_located((By.XPATH, "//span[contains(@class, 'size-text') and contains(text(), '100')]"))
@@ -574,12 +1248,14 @@ class BlackholePoolRecommender:
                         if option_100s:
                             option_100 = option_100s[0]
                             # Click on the parent container (size-container) that contains this span
-                            parent_containers = option_100.find_elements(By.XPATH, "./ancestor::*[contains(@class, 'size-container')][1]")
-                            if parent_containers:
-                                driver.execute_script("arguments[0].click();", parent_containers[0])
+                            parent_container = driver.execute_script(_SIZE_CONTAINER_JS, option_100)
+                            if parent_container:
+                                rows_before = driver.execute_script(_POOL_COUNT_JS) or 0
+                                driver.execute_script("arguments[0].click();", parent_container)
                                 if not quiet:
                                     print("Set pagination to 100 pools per page")
-                                time.sleep(4)  # Wait for pools to reload
+                                # Wait for pools to reload
+                                self._wait_for_pool_count_stable(driver, 100, rows_before, timeout=4)
                     except Exception as e:
                         if not quiet:
                             print(f"Could not find/click option 100: {e}, will try to load all pools via scrolling")
@@ -593,12 +1269,14 @@ class BlackholePoolRecommender:
                 print("Sorting by TOTAL REWARDS...")
             try:
                 # Find and click the TOTAL REWARDS column header - use find_elements with wait
-                total_rewards_headers = WebDriverWait(driver, 5).until(
+                total_rewards_headers = WebDriverWait(driver, self.implicit_wait).until(
                     EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'total-rewards')] | //div[contains(@class, 'liquidity-pool-column-tab') and contains(text(), 'TOTAL REWARDS')]"))
                 )
                 if total_rewards_headers:
+                    first_row_before = driver.execute_script(_FIRST_POOL_TEXT_JS)
                     driver.execute_script("arguments[0].click();", total_rewards_headers[0])
-                    time.sleep(3)  # Wait for sort to complete
+                    # Wait for sort to complete (first row re-renders with different data)
+                    self._wait_for_first_pool_change(driver, first_row_before, timeout=3)
                     if not quiet:
                         print("Sorted by TOTAL REWARDS")
             except Exception as e:
@@ -611,12 +1289,12 @@ class BlackholePoolRecommender:
             pool_container = None
             try:
                 # Find the pools container - try multiple selectors
-                pool_container = driver.find_element(By.XPATH, "//div[contains(@class, 'pools-container')] | //div[contains(@class, 'pool-section')]")
-            except:
+                pool_container = driver.execute_script(_POOLS_CONTAINER_JS)
+            except WebDriverException:
                 pass
             
             # Count initial pools
-            initial_pools = len(driver.find_elements(By.XPATH, "//div[contains(@class, 'liquidity-pool-cell') and (contains(@class, 'even') or contains(@class, 'odd'))]"))
+            initial_pools = driver.execute_script(_POOL_COUNT_JS) or 0
             if not quiet:
                 print(f"Initial pools found: {initial_pools}")
             
@@ -626,18 +1304,8 @@ class BlackholePoolRecommender:
             stable_count = 0
             
             while scroll_attempts < 20:  # More attempts
-                if pool_container:
-                    # Scroll within container
-                    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", pool_container)
-                else:
-                    # Scroll entire page
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                
-                time.sleep(2)
-                
-                # Check how many pools we have now
-                current_pools = driver.find_elements(By.XPATH, "//div[contains(@class, 'liquidity-pool-cell') and (contains(@class, 'even') or contains(@class, 'odd'))]")
-                current_count = len(current_pools)
+                # Scroll within container (or the entire page) and wait until new rows stop arriving
+                current_count = self._scroll_and_wait_for_rows(driver, pool_container, max_pools)
                 
                 if current_count > max_pools:
                     max_pools = current_count
@@ -646,7 +1314,7 @@ class BlackholePoolRecommender:
                         print(f"Found {current_count} pools...")
                 else:
                     stable_count += 1
-                    if stable_count >= 3:  # No new pools for 3 attempts
+                    if stable_count >= 2:  # No new pools for 2 attempts (each waits for quiet)
                         break
                 
                 scroll_attempts += 1
@@ -654,12 +1322,12 @@ class BlackholePoolRecommender:
             if not quiet:
                 print(f"Total pools loaded on current page: {max_pools}")
             
-            # Scroll back to top
+            # Scroll back to top (rows are already rendered; just make sure they still are)
             if pool_container:
                 driver.execute_script("arguments[0].scrollTop = 0", pool_container)
             else:
                 driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            self._wait_for_pool_count_above(driver, 0, timeout=2)
             
             # Extract epoch information from page (only if we didn't get it from API)
             if not self.epoch_close_utc:
@@ -679,22 +1347,17 @@ class BlackholePoolRecommender:
                 # Method 1: Try to extract from DOM elements using Selenium
                 page_pools = []
                 try:
-                    # The actual pool containers are divs with class 'liquidity-pool-cell'
-                    pool_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'liquidity-pool-cell') and (contains(@class, 'even') or contains(@class, 'odd'))]")
+                    # The actual pool containers are divs with class 'liquidity-pool-cell';
+                    # the rows are located and read inside the page in one round-trip
+                    page_pools = self._extract_pools_from_elements(None, driver)
                 
-                    if pool_elements:
+                    if page_pools:
                         if not quiet:
-                            print(f"Found {len(pool_elements)} pool elements on page {page_num}")
-                        page_pools = self._extract_pools_from_elements(pool_elements, driver)
+                            print(f"Found {len(page_pools)} pool elements on page {page_num}")
                     else:
-                        # Fallback: try without even/odd filter
-                        pool_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'liquidity-pool-cell')]")
-                        # Filter to main containers (not nested cells)
-                        main_pools = []
-                        for elem in pool_elements:
-                            classes = elem.get_attribute('class') or ''
-                            if 'even' in classes or 'odd' in classes:
-                                main_pools.append(elem)
+                        # Fallback: try without the exact even/odd class tokens.
+                        # Only main containers (not nested cells) carry even/odd.
+                        main_pools = driver.find_elements(By.CSS_SELECTOR, _POOL_ROW_LOOSE_CSS)
                         if main_pools:
                             if not quiet:
                                 print(f"Found {len(main_pools)} pool elements on page {page_num}")
@@ -709,123 +1372,14 @@ class BlackholePoolRecommender:
                     if not quiet:
                         print(f"Extracted {len(page_pools)} pools from page {page_num} (total so far: {len(all_pools)})")
                 
-                # Check if there's a next page button
+                # Find the next page control (arrow/"Next" button, then the next page number)
+                # with one script that applies every check in the page
                 next_page_button = None
                 try:
-                    # Look for pagination controls - try multiple selectors
-                    # Common patterns: button with "Next", arrow button, page number buttons
-                    next_buttons = driver.find_elements(By.XPATH, 
-                        "//button[contains(text(), 'Next') or contains(@aria-label, 'next') or contains(@aria-label, 'Next')] | "
-                        "//button[contains(@class, 'next')] | "
-                        "//*[contains(@class, 'pagination')]//button[contains(@class, 'next')] | "
-                        "//*[contains(@class, 'pagination')]//button[contains(text(), '?') or contains(text(), '>') or normalize-space(text())='>' or normalize-space(text())='?'] | "
-                        "//*[contains(@class, 'pagination')]//button[normalize-space()='>'] | "
-                        "//*[contains(@class, 'pagination')]//button[normalize-space()='?'] | "
-                        "//button[contains(@class, 'arrow')] | "
-                        "//*[@role='button' and (contains(@class, 'next') or contains(@aria-label, 'next'))]")
-                    
-                    # Also check for disabled state - if next button is disabled, we're on last page
-                    for btn in next_buttons:
-                        try:
-                            classes = btn.get_attribute('class') or ''
-                            disabled = btn.get_attribute('disabled') or btn.get_attribute('aria-disabled') == 'true'
-                            is_displayed = btn.is_displayed()
-                            btn_text = btn.text or ''
-                            
-                            if not disabled and 'disabled' not in classes.lower() and is_displayed:
-                                # Check if it's actually a next button (not previous)
-                                # Exclude buttons with < or ? (previous page arrows)
-                                btn_text_clean = btn_text.strip()
-                                if ('prev' not in classes.lower() and 'previous' not in classes.lower() and 
-                                    'prev' not in btn_text.lower() and
-                                    btn_text_clean not in ['<', '?', '?'] and
-                                    '<' not in btn_text_clean and '?' not in btn_text_clean):
-                                    # Prefer buttons with > or ? (next page arrows)
-                                    if btn_text_clean in ['>', '?', '?'] or '>' in btn_text_clean or '?' in btn_text_clean:
-                                        next_page_button = btn
-                                        break
-                                    # Also accept if it's clearly a next button by class/aria-label
-                                    elif 'next' in classes.lower() or 'next' in (btn.get_attribute('aria-label') or '').lower():
-                                        next_page_button = btn
-                                        break
-                        except Exception as e:
-                            # Silently continue if button check fails
-                            continue
-                            
-                    # If no button found, try looking for page number buttons
-                    if not next_page_button:
-                        try:
-                            # Look for page number buttons - pages are typically numbered
-                            next_page_num = page_num + 1
-                            # Build XPath queries with the page number
-                            page_buttons = driver.find_elements(By.XPATH,
-                                f"//button[text()='{next_page_num}'] | "
-                                f"//*[contains(@class, 'pagination')]//button[text()='{next_page_num}'] | "
-                                f"//*[contains(@class, 'page')]//button[text()='{next_page_num}'] | "
-                                f"//*[@role='button' and text()='{next_page_num}']")
-                            
-                            if page_buttons:
-                                for btn in page_buttons:
-                                    try:
-                                        classes = btn.get_attribute('class') or ''
-                                        disabled = btn.get_attribute('disabled') or btn.get_attribute('aria-disabled') == 'true'
-                                        is_displayed = btn.is_displayed()
-                                        
-                                        if not disabled and 'disabled' not in classes.lower() and is_displayed:
-                                            next_page_button = btn
-                                            break
-                                    except:
-                                        continue
-                            
-                            # If still no button, try to find all clickable page number elements (divs, buttons, etc.)
-                            if not next_page_button:
-                                # Look for clickable elements that might be page numbers
-                                # They could be buttons, divs, or other clickable elements
-                                all_page_elements = driver.find_elements(By.XPATH,
-                                    "//*[contains(@class, 'pagination')]//* | "
-                                    "//*[contains(@class, 'page-result-section')]//* | "
-                                    "//*[contains(@class, 'footer')]//*")
-                                
-                                for elem in all_page_elements:
-                                    try:
-                                        elem_text = elem.text.strip()
-                                        # Check if it's a number matching the next page
-                                        if elem_text.isdigit():
-                                            elem_num = int(elem_text)
-                                            if elem_num == next_page_num:
-                                                # Check if element is clickable (has onclick, is button, or has cursor pointer)
-                                                classes = elem.get_attribute('class') or ''
-                                                tag_name = elem.tag_name.lower()
-                                                onclick = elem.get_attribute('onclick')
-                                                style = elem.get_attribute('style') or ''
-                                                disabled = elem.get_attribute('disabled') or elem.get_attribute('aria-disabled') == 'true'
-                                                is_displayed = elem.is_displayed()
-                                                
-                                                # Check if it looks clickable
-                                                # Since we're in pagination area, elements with numbers are likely clickable
-                                                is_clickable = (
-                                                    tag_name == 'button' or
-                                                    'clickable' in classes.lower() or
-                                                    'cursor:pointer' in style.lower() or
-                                                    onclick is not None or
-                                                    'page' in classes.lower() or
-                                                    tag_name == 'div'  # Divs in pagination are likely clickable
-                                                )
-                                                
-                                                # If it's in pagination area and has the right number, assume it's clickable
-                                                if (not disabled and 'disabled' not in classes.lower() and 
-                                                    is_displayed and (is_clickable or 'pagination' in str(elem.get_attribute('class') or '').lower())):
-                                                    next_page_button = elem
-                                                    break
-                                    except:
-                                        continue
-                        except Exception as e:
-                            # Silently continue if page number search fails
-                            pass
-                                
+                    next_page_button = driver.execute_script(_FIND_NEXT_PAGE_JS, page_num + 1)
                 except Exception as e:
                     # Silently continue if pagination search fails
-                    pass
+                    logger.debug(f"Could not look for the next page control: {e}")
                 
                 # If no next button found or we got no pools, break
                 if not next_page_button:
@@ -838,20 +1392,19 @@ class BlackholePoolRecommender:
                 
                 # Click next page button/element
                 try:
+                    first_row_before = driver.execute_script(_FIRST_POOL_TEXT_JS)
                     # Try multiple click methods to ensure it works
                     try:
                         next_page_button.click()
-                    except:
+                    except WebDriverException:
                         # Fallback to JavaScript click
                         driver.execute_script("arguments[0].click();", next_page_button)
-                    time.sleep(3)  # Wait for page to load
+                    # Wait for the new page to render (first row shows a different pool)
+                    self._wait_for_first_pool_change(driver, first_row_before, timeout=3)
                     
                     # Scroll to load pools on new page
-                    if pool_container:
-                        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", pool_container)
-                    else:
-                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                    rows_before = driver.execute_script(_POOL_COUNT_JS) or 0
+                    self._scroll_and_wait_for_rows(driver, pool_container, rows_before)
                     
                     page_num += 1
                 except Exception as e:
@@ -884,15 +1437,16 @@ class BlackholePoolRecommender:
                     print(f"Error extracting from text: {e}")
                 
                 # Method 3: Try to extract from page source HTML
+                # Parse only the pools container first; the full page_source (the whole
+                # serialized DOM, sent over the driver connection) is the last resort
                 if not pools:
                     print("Trying HTML parsing...")
                     try:
-                        page_source = driver.page_source
-                        if BS4_AVAILABLE:
-                            soup = BeautifulSoup(page_source, 'html.parser')
-                            pools = self._parse_pools_from_html(soup)
-                        else:
-                            pools = self._extract_pools_from_text(page_source)
+                        container_html = driver.execute_script(_POOLS_CONTAINER_HTML_JS)
+                        if container_html:
+                            pools = self._parse_pools_from_markup(container_html)
+                        if not pools:
+                            pools = self._parse_pools_from_markup(driver.page_source)
                     except Exception as e:
                         print(f"Error parsing HTML: {e}")
                 
@@ -907,6 +1461,7 @@ class BlackholePoolRecommender:
             return pools
             
         except KeyboardInterrupt:
+            scrape_failed = True
             if not quiet:
                 print("\nOperation interrupted by user")
             # Try to extract any available data before quitting
@@ -914,485 +1469,527 @@ class BlackholePoolRecommender:
                 try:
                     if not quiet:
                         print("Attempting to extract available data before exit...")
-                    pool_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'liquidity-pool-cell')]")
-                    if pool_elements:
-                        pools = self._extract_pools_from_elements(pool_elements[:min(50, len(pool_elements))], driver)
-                        if pools:
-                            if not quiet:
-                                print(f"Extracted {len(pools)} pools before exit")
-                            return pools
-                except:
+                    # One in-page harvest of the rendered rows; no element handles to fetch first
+                    pools = self._extract_pools_from_elements(None, driver)
+                    if pools:
+                        if not quiet:
+                            print(f"Extracted {len(pools)} pools before exit")
+                        return pools
+                except Exception:
                     pass
             raise
         except Exception as e:
+            scrape_failed = True
             print(f"Error fetching pools with Selenium: {e}")
-            import traceback
             traceback.print_exc()
             raise
         finally:
             if driver:
+                if scrape_failed:
+                    # Don't hand a possibly wedged browser to the next caller
+                    self._shutdown_driver()
+                else:
+                    self._reset_scrape_driver(driver)
+    
+    def _create_scrape_driver(self):
+        """Launch a Chrome instance configured for scraping the vote page"""
+        _load_selenium()
+        options = Options()
+        if self.headless:
+            options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+        options.add_argument('user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        options.add_argument('--log-level=3')  # Fatal errors only; Chrome's console logging is never read
+        # Add timeout settings to prevent hangs
+        options.add_argument('--page-load-strategy=eager')  # Don't wait for all resources
+        if self.block_resources:
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+            })
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        # Record network events so JSON responses can be read back (see _extract_from_network_logs)
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        # Set service with timeout to prevent connection hangs
+        service = Service()
+        driver = webdriver.Chrome(service=service, options=options)
+        if self.block_resources:
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_RESOURCE_PATTERNS})
+            except Exception as e:
+                logger.debug(f"Could not enable resource blocking: {e}")
+        return driver
+    
+    def _get_scrape_driver(self):
+        """
+        Return the process-wide scraping browser, launching it on first use.
+        
+        Chrome takes a second or two to start, so repeated fetches in one process
+        (e.g. when the module is embedded in a long-running tool) reuse a single
+        instance. A browser launched with different options (headless,
+        block_resources) is replaced, as is one that no longer responds.
+        """
+        cls = BlackholePoolRecommender
+        key = (self.headless, self.block_resources)
+        with cls._shared_driver_lock:
+            driver = cls._shared_driver
+            if driver is not None and cls._shared_driver_key == key:
+                try:
+                    driver.current_url  # Cheap liveness check
+                    return driver
+                except Exception:
+                    pass
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass  # Ignore errors during cleanup
+            if cls._shared_driver_key is None:
+                atexit.register(cls._shutdown_driver)
+            cls._shared_driver = self._create_scrape_driver()
+            cls._shared_driver_key = key
+            return cls._shared_driver
+    
+    @staticmethod
+    def _reset_scrape_driver(driver) -> None:
+        """Clear cookies, storage and buffered network logs so the next fetch starts clean"""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.get_log('performance')  # Drain events so the next run only sees its own
+        except Exception:
+            BlackholePoolRecommender._shutdown_driver()
+    
+    @classmethod
+    def _shutdown_driver(cls) -> None:
+        """Quit the shared scraping browser, if one is running"""
+        with cls._shared_driver_lock:
+            driver = cls._shared_driver
+            cls._shared_driver = None
+            if driver is not None:
                 try:
                     driver.quit()
-                except:
+                except Exception:
                     pass  # Ignore errors during cleanup
     
+    def _wait_for_pool_count_above(self, driver, count: int, timeout: float) -> int:
+        """
+        Poll the rendered pool-row count until it exceeds count or timeout expires.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            count: Row count to wait past
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            Latest observed row count (may equal count if nothing new loaded)
+        """
+        _load_selenium()
+        latest = [count]
+        
+        def _grown(d):
+            latest[0] = d.execute_script(_POOL_COUNT_JS) or 0
+            return latest[0] > count
+        
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(_grown)
+        except TimeoutException:
+            pass
+        return latest[0]
+    
+    def _scroll_and_wait_for_rows(self, driver, container, count: int, first_wait: float = 2.0,
+                                  quiet: float = 0.5, timeout: float = 10.0) -> int:
+        """
+        Scroll to the bottom of the pool list and wait for lazy loading to finish.
+        
+        A MutationObserver in the page (_SCROLL_AND_AWAIT_ROWS_JS) reports back
+        once rows stop being added, so the wait lasts as long as loading does
+        rather than a fixed polling interval. Falls back to scrolling and polling
+        the row count if the async script cannot run.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            container: Scrollable pools container element, or None for the window
+            count: Row count before scrolling
+            first_wait: Seconds to wait for the first new row before giving up
+            quiet: Seconds without new rows that mean loading has finished
+            timeout: Maximum seconds to wait overall
+        
+        Returns:
+            Row count after loading settled
+        """
+        try:
+            return driver.execute_async_script(
+                _SCROLL_AND_AWAIT_ROWS_JS, container,
+                int(first_wait * 1000), int(quiet * 1000), int(timeout * 1000)
+            ) or 0
+        except Exception as e:
+            logger.debug(f"Falling back to polling for lazy-loaded rows: {e}")
+        if container:
+            driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", container)
+        else:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        return self._wait_for_pool_count_above(driver, count, timeout=first_wait)
+    
+    def _wait_for_first_pool_change(self, driver, before: Optional[str], timeout: float) -> bool:
+        """
+        Wait for the first pool row to show different content (after a sort or page change).
+        
+        Args:
+            driver: Selenium WebDriver instance
+            before: First row text captured before the triggering click
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if the first row changed before timeout expired
+        """
+        _load_selenium()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+                lambda d: d.execute_script(_FIRST_POOL_TEXT_JS) != before
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _wait_for_pool_count_stable(self, driver, target: int, initial: int,
+                                    timeout: float, settle: float = 0.5) -> int:
+        """
+        Wait for the pool list to finish re-rendering after a pagination change.
+        
+        Returns once the row count reaches target, or once it has moved away from
+        initial and then held steady for settle seconds, or when timeout expires.
+        
+        Args:
+            driver: Selenium WebDriver instance
+            target: Row count that means loading is complete (e.g. page size)
+            initial: Row count observed before the triggering click
+            timeout: Maximum seconds to wait
+            settle: Seconds the count must hold steady to count as loaded
+        
+        Returns:
+            Latest observed row count
+        """
+        _load_selenium()
+        state = {'count': initial, 'since': time.monotonic()}
+        
+        def _settled(d):
+            count = d.execute_script(_POOL_COUNT_JS) or 0
+            now = time.monotonic()
+            if count != state['count']:
+                state['count'] = count
+                state['since'] = now
+            return count >= target or (count != initial and now - state['since'] >= settle)
+        
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(_settled)
+        except TimeoutException:
+            pass
+        return state['count']
+    
     def _extract_pools_from_elements(self, elements, driver) -> List[Pool]:
         """
         Extract pool data from Selenium WebElements.
         
-        Uses find_elements (not find_element) to avoid hanging on implicit wait.
-        Temporarily reduces implicit wait to 0 during extraction for speed.
+        All row fields are harvested in a single execute_script round-trip
+        (_HARVEST_POOL_ROWS_JS) and then parsed in pure Python by _parse_pool_row,
+        instead of issuing find_elements/.text/get_attribute calls per field per row.
+        Pass elements=None to harvest every pool row on the page without first
+        fetching the rows as WebElements. If the harvest script fails, the rows'
+        markup is fetched in one call instead and read locally (_snapshot_pool_rows).
         
         NOTE: Votability filtering approach (for future implementation):
         Non-votable pools have a 'data-tooltip-id="no-locks-available"' attribute in the button container.
-        To filter them out:
-        1. Find button container: element.find_elements(...)
-        2. Check for tooltip: button_container.find_elements(...)
-        3. If tooltip exists, skip the pool (not votable)
+        _parse_pool_row currently treats such rows as disabled and skips them.
+        """
+        if elements is not None and not elements:
+            return []
+        
+        try:
+            rows = driver.execute_script(
+                _HARVEST_POOL_ROWS_JS, list(elements) if elements is not None else None
+            ) or []
+        except Exception as e:
+            logger.debug(f"In-page row harvest failed, parsing a DOM snapshot instead: {e}")
+            try:
+                rows = self._snapshot_pool_rows(driver, elements)
+            except Exception as e:
+                # Connection lost or stale rows - nothing can be read from this batch
+                logger.warning(f"Could not read pool rows from the page: {e}")
+                return []
+        
+        # Note: extraction success/failure messages handled by caller (quiet flag)
         
-        This filtering should be done AFTER extraction is complete to avoid breaking the extraction logic.
+        return list(self._iter_pools_from_rows(rows))
+    
+    def _iter_pools_from_rows(self, rows) -> Iterator[Pool]:
         """
-        pools = []
-        extraction_errors = []
+        Yield a Pool for each harvested row that _parse_pool_row accepts.
         
-        # Temporarily set implicit wait to 0 during extraction to avoid hangs
-        # Save current implicit wait (from driver config) before changing it
-        # Note: implicitly_wait() doesn't return the old value, so we use self.implicit_wait
-        original_implicit_wait = self.implicit_wait
-        driver.implicitly_wait(0)
+        Rows that fail to parse are logged and skipped. Unnamed pools get
+        fallback names Pool_1, Pool_2, ... in the order they are yielded.
+        """
+        count = 0
+        for row in rows:
+            try:
+                pool = self._parse_pool_row(row, fallback_name=f"Pool_{count+1}")
+            except Exception as e:
+                logger.debug(f"Error parsing pool row: {e}")
+                continue
+            if pool:
+                count += 1
+                yield pool
+    
+    def _snapshot_pool_rows(self, driver, elements) -> List[dict]:
+        """
+        Read pool rows from one HTML snapshot instead of the live DOM.
+        
+        Fetches the rows' outerHTML (or the pools container's, or the whole
+        page_source when elements is None) in a single round-trip and extracts
+        the same fields as _HARVEST_POOL_ROWS_JS locally with BeautifulSoup.
+        
+        Returns:
+            Harvested rows for _parse_pool_row (empty without BeautifulSoup)
+        """
+        if not BS4_AVAILABLE:
+            return []
+        if elements is not None:
+            html = driver.execute_script(
+                "return Array.from(arguments[0], row => row.outerHTML).join('');", list(elements))
+        else:
+            html = driver.execute_script(_POOLS_CONTAINER_HTML_JS) or driver.page_source
+        _load_bs4()
+        soup = BeautifulSoup(html or '', _HTML_PARSER, parse_only=SoupStrainer('div', class_=_RE_POOL_ROW_CLASS))
+        return self._harvest_pool_rows_from_soup(soup)
+    
+    def _parse_pool_row(self, row: dict, fallback_name: str) -> Optional[Pool]:
+        """
+        Build a Pool from one harvested pool row (see _HARVEST_POOL_ROWS_JS).
+        
+        Pure Python - no driver calls - so it can be tested without a browser.
+        
+        Args:
+            row: Row fields as returned by _HARVEST_POOL_ROWS_JS
+            fallback_name: Name to use when no pool name can be found
         
+        Returns:
+            Pool, or None if the row is disabled, has no rewards, or has no content
+        """
+        text = row.get('text') or ''
+        
+        # Skip if element doesn't have meaningful content
+        if len(text) < 10:
+            return None
+        
+        # Check if pool element is disabled/inactive (won't pay rewards)
+        # Look for disabled state, opacity, inactive styling, or tooltip indicators
+        pool_disabled = False
+        element_classes = (row.get('classes') or '').lower()
+        element_style = row.get('style') or ''
+        if any(indicator in element_classes for indicator in _DISABLED_CLASS_MARKERS):
+            pool_disabled = True
         try:
-            for idx, element in enumerate(elements):
-                try:
-                    # Add connection health check every 10 elements
-                    if idx > 0 and idx % 10 == 0:
-                        try:
-                            # Quick health check - try to get page title (with short timeout)
-                            from selenium.common.exceptions import TimeoutException
-                            from selenium.webdriver.support.ui import WebDriverWait
-                            WebDriverWait(driver, 1).until(lambda d: d.title is not None)
-                        except (TimeoutException, Exception):
-                            # Connection lost or timeout - skip remaining elements
-                            logger.warning(f"Connection timeout after {idx} elements. Extracted {len(pools)} pools so far.")
+            # Low opacity (computed or inline) might indicate disabled state
+            if row.get('opacity') and float(row['opacity']) < 0.5:
+                pool_disabled = True
+            if 'opacity' in element_style.lower():
+                opacity_match = _RE_OPACITY.search(element_style)
+                if opacity_match and float(opacity_match.group(1)) < 0.5:
+                    pool_disabled = True
+        except ValueError:
+            pass
+        # Non-votable pools have a 'data-tooltip-id="no-locks-available"' button container
+        for tooltip_id, tooltip_text in row.get('buttons') or ():
+            if 'no-locks-available' in tooltip_id.lower() or 'no reward' in tooltip_text.lower():
+                pool_disabled = True
+                break
+        
+        # Pool name is in a div with class "name" inside the left section
+        name = row.get('name') or "Unknown"
+        if name == "Unknown":
+            # Fallback: a token pair on the first line of the left section (or of the whole
+            # row); anything else keeps fallback_name rather than a stray word or number
+            lines = [line.strip() for line in (row.get('left') or text).split('\n') if line.strip()]
+            if lines:
+                # Look for a pattern like "CL200-WAVAX/USDC", else a bare "WAVAX/USDC"
+                best_match = None
+                for name_match in _RE_POOL_NAME.finditer(lines[0]):
+                    if best_match is None or name_match.lastindex < best_match.lastindex:
+                        best_match = name_match
+                        if best_match.lastindex == 1:
                             break
-                    
-                    text = element.text.strip()
-                    
-                    # Skip if element doesn't have meaningful content
-                    if not text or len(text) < 10:
-                        continue
-                    
-                    # Check if pool element is disabled/inactive (won't pay rewards)
-                    # Look for disabled state, opacity, inactive styling, or tooltip indicators
-                    pool_disabled = False
-                    try:
-                        element_classes = element.get_attribute('class') or ''
-                        element_style = element.get_attribute('style') or ''
-                        element_opacity = element.value_of_css_property('opacity') if hasattr(element, 'value_of_css_property') else None
-                        
-                        # Check for disabled/inactive indicators in class names
-                        disabled_indicators = ['disabled', 'inactive', 'no-reward', 'paused', 'gray', 'grey']
-                        if any(indicator in element_classes.lower() for indicator in disabled_indicators):
-                            pool_disabled = True
-                        
-                        # Check opacity (low opacity might indicate disabled state)
-                        if element_opacity and float(element_opacity) < 0.5:  # Very low opacity might indicate disabled
-                            pool_disabled = True
-                        if 'opacity' in element_style.lower():
-                            opacity_match = re.search(r'opacity\s*:\s*([\d.]+)', element_style)
-                            if opacity_match and float(opacity_match.group(1)) < 0.5:
-                                pool_disabled = True
-                        
-                        # Check for tooltip indicating pool is not votable (won't pay rewards)
-                        # Non-votable pools have a 'data-tooltip-id="no-locks-available"' attribute in button container
-                        try:
-                            button_containers = element.find_elements(By.XPATH, ".//*[contains(@class, 'liquidity-pool-cell-btn')] | .//*[contains(@class, 'button')] | .//button")
-                            for btn_container in button_containers[:3]:  # Check first few button containers
-                                tooltip_id = btn_container.get_attribute('data-tooltip-id') or ''
-                                tooltip_text = btn_container.get_attribute('data-tooltip-content') or btn_container.get_attribute('title') or ''
-                                # Check for indicators that pool won't pay rewards
-                                if 'no-locks-available' in tooltip_id.lower() or 'no reward' in tooltip_text.lower():
-                                    pool_disabled = True
-                                    break
-                        except:
-                            pass
-                    except:
-                        pass
-                    
-                    # Extract pool name and metadata from left section
-                    name = "Unknown"
-                    pool_type = None
-                    fee_percentage = None
-                    pool_id = None  # Pool contract address or identifier
-                    
-                    try:
-                        # Pool name is in a div with class "name" inside the left section
-                        # Use explicit wait with short timeout to avoid hanging
-                        # Use find_elements to avoid hanging on implicit wait
-                        name_elements = element.find_elements(By.XPATH, ".//div[contains(@class, 'name')]")
-                        if name_elements:
-                            name_text = name_elements[0].text.strip()
-                        else:
-                            name_text = ""
-                        
-                        # Use the full name text, don't truncate it
-                        if name_text:
-                            name = name_text
-                            # Determine pool type from name
-                            if name.startswith('vAMM'):
-                                pool_type = 'vAMM'
-                            elif name.startswith('CL200'):
-                                pool_type = 'CL200'
-                            elif name.startswith('CL1'):
-                                pool_type = 'CL1'
-                        
-                        # Try to extract pool ID/address from data attributes and HTML content
-                        try:
-                            # Check for data attributes that might contain pool address
-                            pool_id = (
-                                element.get_attribute('data-pool-id') or
-                                element.get_attribute('data-pool-address') or
-                                element.get_attribute('data-address') or
-                                element.get_attribute('data-id')
-                            )
-                            # Also check child elements (use find_elements to avoid hanging)
-                            if not pool_id:
-                                try:
-                                    id_elements = element.find_elements(By.XPATH, ".//*[@data-pool-id or @data-pool-address or @data-address]")
-                                    if id_elements:
-                                        id_element = id_elements[0]
-                                        pool_id = (
-                                            id_element.get_attribute('data-pool-id') or
-                                            id_element.get_attribute('data-pool-address') or
-                                            id_element.get_attribute('data-address')
-                                        )
-                                except:
-                                    pass
-                            
-                            # Fallback: Extract Ethereum address from HTML content (pool contract address)
-                            if not pool_id:
-                                try:
-                                    inner_html = element.get_attribute('innerHTML')
-                                    if inner_html:
-                                        # Look for Ethereum addresses (0x followed by 40 hex characters)
-                                        import re
-                                        eth_addresses = re.findall(r'0x[a-fA-F0-9]{40}', inner_html)
-                                        if eth_addresses:
-                                            # Use the first unique address found
-                                            # Filter out common contract addresses that might appear on every pool
-                                            unique_addresses = list(set(eth_addresses))
-                                            # Take the first one (most likely the pool address)
-                                            pool_id = unique_addresses[0]
-                                except:
-                                    pass
-                            
-                            # Also check tooltip IDs which sometimes contain addresses
-                            if not pool_id:
-                                try:
-                                    tooltip_elements = element.find_elements(By.XPATH, ".//*[contains(@data-tooltip-id, 'pool-address') or contains(@data-tooltip-id, 'address')]")
-                                    if tooltip_elements:
-                                        tooltip_id = tooltip_elements[0].get_attribute('data-tooltip-id')
-                                        # Extract address from tooltip ID like "pool-address-tooltip-0x..."
-                                        if tooltip_id:
-                                            match = re.search(r'0x[a-fA-F0-9]{40}', tooltip_id)
-                                            if match:
-                                                pool_id = match.group(0)
-                                except:
-                                    pass
-                        except:
-                            pass
-                        
-                        # Extract fee percentage (use find_elements to avoid implicit wait)
-                        try:
-                            gas_info_elements = element.find_elements(By.XPATH, ".//div[contains(@class, 'gas-info')]//div[contains(@class, 'text')]")
-                            if gas_info_elements:
-                                fee_percentage = gas_info_elements[0].text.strip()
-                        except:
-                            pass
-                    except:
-                        # Fallback: try to find name in left section (use find_elements to avoid hanging)
-                        try:
-                            left_sections = element.find_elements(By.XPATH, ".//div[contains(@class, 'liquidity-pool-cell-left')] | .//div[contains(@class, 'liquidity-pool-cell-description')]")
-                            if left_sections:
-                                left_section = left_sections[0]
-                                name_text = left_section.text.strip()
-                            else:
-                                name_text = ""
-                            
-                            # Look for the first line which usually contains the pool name
-                            lines = [line.strip() for line in name_text.split('\n') if line.strip()]
-                            if lines:
-                                # First line is usually the pool name
-                                first_line = lines[0]
-                                # Extract name - look for pattern like "CL200-WAVAX/USDC" or "CL200-WETH.e/USDt"
-                                name_patterns = [
-                                    r'([A-Z0-9\-]+-[A-Z0-9\.]+/[A-Z0-9\.]+)',  # CL200-WAVAX/USDC or CL200-WETH.e/USDt
-                                    r'([A-Z0-9\.]+/[A-Z0-9\.]+)',  # WAVAX/USDC
-                                    r'([A-Z0-9\-]+)',  # CL200
-                                ]
-                                
-                                for pattern in name_patterns:
-                                    name_match = re.search(pattern, first_line)
-                                    if name_match:
-                                        name = name_match.group(1)
-                                        break
-                                
-                                # If pattern matching didn't work, use the first line as-is (up to reasonable length)
-                                if name == "Unknown" and len(first_line) < 50:
-                                    name = first_line
-                        except:
-                            # Final fallback: extract from full text
-                            name_match = re.search(r'([A-Z0-9\-]+-[A-Z0-9\.]+/[A-Z0-9\.]+)|([A-Z0-9\.]+/[A-Z0-9\.]+)', text)
-                            if name_match:
-                                name = name_match.group(1) or name_match.group(2)
-                    
-                    # Extract total rewards - it's in slots 6 or 7 (shows "Fees + Incentives")
-                    # Columns order: 0-1=TVL, 2-3=FEES, 4=INCENTIVES, 5-6=TOTAL REWARDS, 7-8=VOTES/vAPR
-                    total_rewards = 0.0
-                    rewards_text_found = None  # Track the actual rewards text we found
-                    try:
-                        # Use find_elements to avoid hanging on implicit wait
-                        right_sections = element.find_elements(By.XPATH, ".//div[contains(@class, 'liquidity-pool-cell-right')]")
-                        if not right_sections:
-                            raise Exception("Right section not found")
-                        right_section = right_sections[0]
-                        slots = right_section.find_elements(By.XPATH, ".//div[contains(@class, 'voting-pool-cell-slot')]")
-                        
-                        # Look for TOTAL REWARDS - it's in slot 6 or 7, contains "Fees + Incentives"
-                        if len(slots) >= 7:
-                            # Try slot 6 first (most common)
-                            rewards_text = slots[6].text.strip()
-                            if 'Fees + Incentives' in rewards_text or 'fee' in rewards_text.lower():
-                                rewards_text_found = rewards_text
-                                # Explicitly check for $0, "--", empty, or "No rewards" or similar
-                                # Empty or whitespace-only text might indicate no rewards
-                                if not rewards_text or rewards_text.strip() == '' or rewards_text.strip() == '--':
-                                    total_rewards = 0.0  # Empty or "--" means no rewards
-                                elif any(zero_indicator in rewards_text for zero_indicator in ['$0', '$0.00', '$0,000', '--', '?', '?', 'no reward', 'n/a', 'n/a']):
-                                    total_rewards = 0.0  # Explicitly set to 0 if we see indicators
-                                else:
-                                    rewards_match = re.search(r'\$[\d,]+\.?\d*', rewards_text)
-                                    if rewards_match:
-                                        total_rewards = float(rewards_match.group(0).replace('$', '').replace(',', '').replace('~', ''))
-                            
-                            # If not found, try slot 7
-                            if total_rewards == 0.0 and len(slots) >= 8:
-                                rewards_text = slots[7].text.strip()
-                                if 'Fees + Incentives' in rewards_text or 'fee' in rewards_text.lower():
-                                    rewards_text_found = rewards_text
-                                    # Explicitly check for $0, "--", empty, or "No rewards" or similar
-                                    if not rewards_text or rewards_text.strip() == '' or rewards_text.strip() == '--':
-                                        total_rewards = 0.0  # Empty or "--" means no rewards
-                                    elif any(zero_indicator in rewards_text for zero_indicator in ['$0', '$0.00', '$0,000', '--', '?', '?', 'no reward', 'n/a', 'n/a']):
-                                        total_rewards = 0.0  # Explicitly set to 0 if we see indicators
-                                    else:
-                                        rewards_match = re.search(r'\$[\d,]+\.?\d*', rewards_text)
-                                        if rewards_match:
-                                            total_rewards = float(rewards_match.group(0).replace('$', '').replace(',', '').replace('~', ''))
-                        
-                        # Fallback: search all slots for "Fees + Incentives"
-                        if total_rewards == 0.0 and rewards_text_found is None:
-                            for slot in slots:
-                                slot_text = slot.text.strip()
-                                if 'Fees + Incentives' in slot_text or ('fee' in slot_text.lower() and 'incentive' in slot_text.lower()):
-                                    rewards_text_found = slot_text
-                                    # Explicitly check for $0, "--", empty, or "No rewards" or similar
-                                    if not slot_text or slot_text.strip() == '' or slot_text.strip() == '--':
-                                        total_rewards = 0.0  # Empty or "--" means no rewards
-                                        break
-                                    elif any(zero_indicator in slot_text for zero_indicator in ['$0', '$0.00', '$0,000', '--', '?', '?', 'no reward', 'n/a', 'n/a']):
-                                        total_rewards = 0.0  # Explicitly set to 0 if we see indicators
-                                        break
-                                    rewards_match = re.search(r'\$[\d,]+\.?\d*', slot_text)
-                                    if rewards_match:
-                                        total_rewards = float(rewards_match.group(0).replace('$', '').replace(',', '').replace('~', ''))
-                                        break
-                    except Exception as e:
-                        pass
-                    
-                    # Fallback: if not found in column, search full text (but only if we didn't already find $0)
-                    # Only use fallback if we haven't explicitly found a rewards field that says $0
-                    if total_rewards == 0.0 and rewards_text_found is None:
-                        # Find all $ amounts
-                        rewards_matches = re.findall(r'\$[\d,]+\.?\d*', text)
-                        if rewards_matches:
-                            reward_values = []
-                            for match in rewards_matches:
-                                try:
-                                    val = float(match.replace('$', '').replace(',', '').replace('~', ''))
-                                    # Skip explicit $0 values
-                                    if val > 0:
-                                        reward_values.append(val)
-                                except:
-                                    pass
-                            if reward_values:
-                                # Total rewards is typically the 2nd or 3rd largest (after TVL)
-                                reward_values.sort(reverse=True)
-                                # Skip TVL (usually largest), take next largest
-                                if len(reward_values) > 1:
-                                    total_rewards = reward_values[1]  # Second largest
-                                elif reward_values:
-                                    total_rewards = reward_values[0]
-                            # If all values are $0, keep total_rewards as 0.0
-                    
-                    # Extract VAPR - it's the 5th column (index 4)
-                    vapr = 0.0
-                    try:
-                        # Use find_elements to avoid hanging on implicit wait
-                        right_sections = element.find_elements(By.XPATH, ".//div[contains(@class, 'liquidity-pool-cell-right')]")
-                        if not right_sections:
-                            raise Exception("Right section not found")
-                        right_section = right_sections[0]
-                        slots = right_section.find_elements(By.XPATH, ".//div[contains(@class, 'voting-pool-cell-slot')]")
-                        
-                        # VAPR is usually 5th column (index 4) or look for "vapr" class
-                        if len(slots) >= 5:
-                            vapr_text = slots[4].text
-                            vapr_match = re.search(r'([\d,]+\.?\d*)\s*%', vapr_text)
-                            if vapr_match:
-                                vapr = float(vapr_match.group(1).replace(',', ''))
-                    except:
-                        pass
-                    
-                    # Fallback: search text for percentages
-                    if vapr == 0.0:
-                        percentages = re.findall(r'([\d,]+\.?\d*)\s*%', text)
-                        if percentages:
-                            vapr_values = [float(p.replace(',', '')) for p in percentages]
-                            # VAPR is usually > 50%
-                            large_percentages = [v for v in vapr_values if v > 50]
-                            if large_percentages:
-                                vapr = max(large_percentages)
-                            elif vapr_values:
-                                vapr = max(vapr_values)
-                    
-                    # Extract votes - it's in the last column (VOTES)
-                    # Columns order: 0-1=TVL, 2-3=FEES, 4=INCENTIVES, 5-6=TOTAL REWARDS, 7-8=VOTES/vAPR
-                    # Votes can be: "6,967" (no M) or "31.29M" (with M for millions)
-                    # Votes are typically in slot 7 or 8, often with VAPR percentage on the same line
-                    votes = None
-                    try:
-                        # Use find_elements to avoid hanging on implicit wait
-                        right_sections = element.find_elements(By.XPATH, ".//div[contains(@class, 'liquidity-pool-cell-right')]")
-                        if not right_sections:
-                            raise Exception("Right section not found")
-                        right_section = right_sections[0]
-                        slots = right_section.find_elements(By.XPATH, ".//div[contains(@class, 'voting-pool-cell-slot')]")
-                        
-                        # Check slots 7 and 8 (last two slots) for votes
-                        # Votes are usually the first number in these slots
-                        for slot_idx in [7, 8]:
-                            if slot_idx < len(slots):
-                                votes_text = slots[slot_idx].text.strip()
-                                
-                                # Split by newlines - votes are usually on the first line
-                                lines = votes_text.split('\n')
-                                if lines:
-                                    first_line = lines[0].strip()
-                                    
-                                    # First check for M suffix (millions)
-                                    votes_match = re.search(r'([\d,]+\.?\d*)\s*[Mm]', first_line)
-                                    if votes_match:
-                                        votes_str = votes_match.group(1).replace(',', '')
-                                        votes = float(votes_str) * 1_000_000
-                                        break
-                                    
-                                    # Then check for numbers without M (like "544,767" or "6,967")
-                                    # Extract the first number from the line
-                                    numbers = re.findall(r'\b([\d,]+)\b', first_line)
-                                    if numbers:
-                                        # Take the first number that looks like votes
-                                        for num_str in numbers:
-                                            num_val = float(num_str.replace(',', ''))
-                                            # Votes without M are typically >= 1000
-                                            if num_val >= 1000:
-                                                votes = num_val
-                                                break
-                                        if votes is not None:
-                                            break
-                        
-                        # If still not found, check all slots in reverse
-                        if votes is None:
-                            for slot_idx in range(len(slots) - 1, max(6, len(slots) - 4), -1):
-                                votes_text = slots[slot_idx].text.strip()
-                                lines = votes_text.split('\n')
-                                if lines:
-                                    first_line = lines[0].strip()
-                                    votes_match = re.search(r'([\d,]+\.?\d*)\s*[Mm]', first_line)
-                                    if votes_match:
-                                        votes_str = votes_match.group(1).replace(',', '')
-                                        votes = float(votes_str) * 1_000_000
-                                        break
-                                    numbers = re.findall(r'\b([\d,]+)\b', first_line)
-                                    if numbers:
-                                        for num_str in numbers:
-                                            num_val = float(num_str.replace(',', ''))
-                                            if num_val >= 1000:
-                                                votes = num_val
-                                                break
-                                        if votes is not None:
-                                            break
-                        
-                    except:
-                        pass
-                    
-                    # Fallback: search full text for votes pattern (only if not found in slots)
-                    if votes is None:
-                        # First try pattern with M suffix (millions)
-                        votes_match = re.search(r'([\d,]+\.?\d*)\s*[Mm]\b', text)
-                        if votes_match:
-                            votes_str = votes_match.group(1).replace(',', '')
-                            votes = float(votes_str) * 1_000_000
-                        else:
-                            # Look for standalone numbers that could be votes
-                            # Extract numbers and find the largest one that's likely votes
-                            numbers = re.findall(r'\b([\d,]+)\b', text)
-                            vote_candidates = []
-                            for num_str in numbers:
-                                num_val = float(num_str.replace(',', ''))
-                                # Votes are typically between 1,000 and 999,999 (without M)
-                                if 1000 <= num_val < 1000000:
-                                    # Check context to avoid percentages and dollar amounts
-                                    num_pos = text.find(num_str)
-                                    if num_pos >= 0:
-                                        context = text[max(0, num_pos - 10):min(len(text), num_pos + len(num_str) + 10)]
-                                        if '$' not in context and '%' not in context:
-                                            vote_candidates.append(num_val)
-                            
-                            # If multiple candidates, take the largest (most likely to be votes)
-                            if vote_candidates:
-                                votes = max(vote_candidates)
-                    
-                    # Only add pool if it has meaningful data AND is not disabled
-                    # Require total_rewards > 0 (not just vapr > 0) to ensure pool will actually pay rewards
-                    if not pool_disabled and total_rewards > 0:
-                        pools.append(Pool(
-                            name=name if name != "Unknown" else f"Pool_{len(pools)+1}",
-                            total_rewards=total_rewards,
-                            vapr=vapr,
-                            current_votes=votes,
-                            pool_id=pool_id,  # May be None if not found - use this to distinguish pools with same token pair
-                            pool_type=pool_type,
-                            fee_percentage=fee_percentage
-                        ))
-                    elif pool_disabled:
-                        # Log skipped pools for debugging
-                        pool_identifier = pool_id or name
-                        logger.debug(f"Skipping pool {pool_identifier} ({pool_type or 'unknown type'}) - appears disabled/inactive")
-                    elif total_rewards == 0.0:
-                        # Log pools with $0 rewards for debugging (including pool type to help identify which one)
-                        pool_identifier = pool_id or name
-                        logger.debug(f"Skipping pool {pool_identifier} ({pool_type or 'unknown type'}) - total rewards is $0 (likely shows '--' in UI)")
-                except Exception as e:
-                    extraction_errors.append(str(e))
+                if best_match:
+                    name = best_match.group(best_match.lastindex)
+        
+        # Determine pool type from name
+        pool_type = None
+        if name.startswith('vAMM'):
+            pool_type = 'vAMM'
+        elif name.startswith('CL200'):
+            pool_type = 'CL200'
+        elif name.startswith('CL1'):
+            pool_type = 'CL1'
+        
+        # Pool contract address: data attributes, then an address in the row HTML,
+        # then a tooltip ID like "pool-address-tooltip-0x..."
+        pool_id = row.get('pool_id')
+        if not pool_id and row.get('tooltip_id'):
+            address_match = _RE_ETH_ADDRESS.search(row['tooltip_id'])
+            if address_match:
+                pool_id = address_match.group(0)
+        
+        # Disabled pools are dropped regardless of their numbers, so skip the slot parsing
+        if pool_disabled:
+            logger.debug(f"Skipping pool {pool_id or name} ({pool_type or 'unknown type'}) - appears disabled/inactive")
+            return None
+        
+        fee_percentage = row.get('fee') or None
+        
+        # Column slots of the right section
+        # Columns order: 0-1=TVL, 2-3=FEES, 4=INCENTIVES, 5-6=TOTAL REWARDS, 7-8=VOTES/vAPR
+        slots = row.get('slots') or []
+        
+        # Extract total rewards - it's in slots 6 or 7 (shows "Fees + Incentives")
+        total_rewards = 0.0
+        rewards_text_found = None  # Track the actual rewards text we found
+        if len(slots) >= 7:
+            # Try slot 6 first (most common), then slot 7
+            for slot_idx in (6, 7):
+                if slot_idx >= len(slots) or total_rewards != 0.0:
+                    break
+                rewards_text = slots[slot_idx]
+                if 'Fees + Incentives' in rewards_text or 'fee' in rewards_text.lower():
+                    rewards_text_found = rewards_text
+                    total_rewards = _parse_rewards_slot(rewards_text) or 0.0
+        
+        # Fallback: search all slots for "Fees + Incentives"
+        if total_rewards == 0.0 and rewards_text_found is None:
+            for slot_text in slots:
+                if 'Fees + Incentives' in slot_text or ('fee' in slot_text.lower() and 'incentive' in slot_text.lower()):
+                    rewards_text_found = slot_text
+                    slot_rewards = _parse_rewards_slot(slot_text)
+                    if slot_rewards is not None:
+                        total_rewards = slot_rewards
+                        break
+        
+        # Fallback: if not found in column, search full text (but only if we didn't already find $0)
+        if total_rewards == 0.0 and rewards_text_found is None:
+            # Total rewards is typically the 2nd largest amount (after TVL, usually the
+            # largest); track the top two in one pass. Explicit $0 values are skipped.
+            largest = second = 0.0
+            for match in _RE_DOLLAR.findall(text):
+                try:
+                    val = _parse_number(match)
+                except ValueError:
                     continue
-        finally:
-            # Restore original implicit wait
-            driver.implicitly_wait(original_implicit_wait)
+                if val > largest:
+                    largest, second = val, largest
+                elif val > second:
+                    second = val
+            total_rewards = second or largest
+        
+        # Extract VAPR - it's the 5th column (index 4)
+        vapr = 0.0
+        if len(slots) >= 5:
+            vapr_match = _RE_VAPR.search(slots[4])
+            if vapr_match:
+                vapr = _parse_number(vapr_match.group(1))
+        
+        # Fallback: search text for percentages
+        if vapr == 0.0:
+            vapr_values = [_parse_number(p) for p in _RE_VAPR.findall(text)]
+            if vapr_values:
+                # VAPR is usually > 50%
+                large_percentages = [v for v in vapr_values if v > 50]
+                vapr = max(large_percentages) if large_percentages else max(vapr_values)
+        
+        # Extract votes - it's in the last column (VOTES), usually slot 7 or 8
+        # Votes can be: "6,967" (no M) or "31.29M" (with M for millions)
+        votes = None
+        for slot_idx in (7, 8):
+            if slot_idx < len(slots):
+                votes = _parse_votes_line(slots[slot_idx].split('\n', 1)[0].strip())
+                if votes is not None:
+                    break
         
-        # Note: extraction success/failure messages handled by caller (quiet flag)
+        # If still not found, check the last few slots in reverse (7 and 8 were just tried)
+        if votes is None:
+            for slot_idx in range(len(slots) - 1, max(8, len(slots) - 4), -1):
+                votes = _parse_votes_line(slots[slot_idx].split('\n', 1)[0].strip())
+                if votes is not None:
+                    break
         
-        return pools
+        # Fallback: search full text for votes pattern (only if not found in slots)
+        if votes is None:
+            # First try pattern with M suffix (millions), only if the text has an M at all
+            votes_match = _RE_VOTES_M.search(text) if ('M' in text or 'm' in text) else None
+            if votes_match:
+                votes = _parse_number(votes_match.group(1)) * 1_000_000
+            else:
+                # Look for standalone numbers that could be votes; if there are several,
+                # keep the largest (most likely to be votes)
+                for num_match in _RE_VOTE_COUNT.finditer(text):
+                    num_val = _parse_number(num_match.group(1))
+                    # Votes are typically between 1,000 and 999,999 (without M)
+                    if 1000 <= num_val < 1000000 and (votes is None or num_val > votes):
+                        # Check context to avoid percentages and dollar amounts
+                        context = text[max(0, num_match.start() - 10):num_match.end() + 10]
+                        if '$' not in context and '%' not in context:
+                            votes = num_val
+        
+        # Only add pool if it has meaningful data (disabled pools were dropped above)
+        # Require total_rewards > 0 (not just vapr > 0) to ensure pool will actually pay rewards
+        if total_rewards <= 0:
+            # Including pool type helps identify which one
+            logger.debug(f"Skipping pool {pool_id or name} ({pool_type or 'unknown type'}) - total rewards is $0 (likely shows '--' in UI)")
+            return None
+        
+        return Pool(
+            name=name if name != "Unknown" else fallback_name,
+            total_rewards=total_rewards,
+            vapr=vapr,
+            current_votes=votes,
+            pool_id=pool_id,  # May be None if not found - use this to distinguish pools with same token pair
+            pool_type=pool_type,
+            fee_percentage=fee_percentage
+        )
+    
+    def _get_page_text(self, driver) -> str:
+        """
+        Get the visible text of the current page, falling back to text extracted
+        from page_source when the body text lacks the voting deadline.
+        
+        The result is kept for a few seconds per URL (self._page_text_cache), so
+        repeated epoch lookups on an unchanged page do not re-serialize and
+        re-parse the whole document.
+        """
+        try:
+            url = driver.current_url
+        except Exception:
+            url = None
+        cached = self._page_text_cache
+        if cached and url is not None and cached[0] == url and time.monotonic() - cached[1] < _PAGE_TEXT_CACHE_SECONDS:
+            return cached[2]
+        
+        # Try multiple sources: body text, then page source
+        page_text = ""
+        try:
+            page_text = driver.execute_script(_BODY_TEXT_JS) or ""
+            
+            # Also get page source for more complete text (some React apps don't expose all text in .text)
+            if not page_text or 'Voting deadline' not in page_text and 'deadline' not in page_text.lower():
+                page_text = _html_to_text(driver.page_source)
+        except Exception as e:
+            logger.debug(f"Error getting page text: {e}")
+        
+        if url is not None:
+            self._page_text_cache = (url, time.monotonic(), page_text)
+        return page_text
     
     def _extract_epoch_info(self, driver, quiet: bool = False):
         """
@@ -1401,42 +1998,15 @@ class BlackholePoolRecommender:
         Looks for the specific pattern: "Voting deadline for epoch #<epochNumber>" 
         followed by time remaining (days/hours until epoch close).
         """
+        _load_selenium()
+        # One clock reading for every strategy; countdowns are days or hours long,
+        # so the time spent reading the page does not matter
+        now_utc = datetime.now(timezone.utc)
         try:
-            from datetime import timedelta
-            
-            # Get page text to search for the voting deadline pattern
-            # Try multiple sources: body text, page source, and specific elements
-            page_text = ""
-            try:
-                body_elements = driver.find_elements(By.TAG_NAME, "body")
-                if body_elements:
-                    page_text = body_elements[0].text
-                
-                # Also get page source for more complete text (some React apps don't expose all text in .text)
-                if not page_text or 'Voting deadline' not in page_text and 'deadline' not in page_text.lower():
-                    page_source = driver.page_source
-                    # Extract text from HTML
-                    if BS4_AVAILABLE:
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(page_source, 'html.parser')
-                        page_text = soup.get_text(separator='\n')
-                    else:
-                        # Basic extraction without BeautifulSoup
-                        import re as re_module
-                        # Remove script and style tags
-                        page_source = re_module.sub(r'<script[^>]*>.*?</script>', '', page_source, flags=re_module.DOTALL | re_module.IGNORECASE)
-                        page_source = re_module.sub(r'<style[^>]*>.*?</style>', '', page_source, flags=re_module.DOTALL | re_module.IGNORECASE)
-                        # Extract text between tags (simple version)
-                        page_text = re_module.sub(r'<[^>]+>', '\n', page_source)
-            except Exception as e:
-                logger.debug(f"Error getting page text: {e}")
-                pass
-            
             # Strategy 0: Look for specific elements with class="pending-time clickable" and data-tooltip-id="voting-epoch-tooltip"
             try:
-                pending_time_elements = driver.find_elements(By.XPATH, 
-                    "//*[@class='pending-time clickable' and @data-tooltip-id='voting-epoch-tooltip'] | "
-                    "//*[contains(@class, 'pending-time') and contains(@class, 'clickable') and @data-tooltip-id='voting-epoch-tooltip']")
+                pending_time_elements = driver.find_elements(By.CSS_SELECTOR,
+                    "[class*='pending-time'][class*='clickable'][data-tooltip-id='voting-epoch-tooltip']")
                 
                 for elem in pending_time_elements:
                     # Get the text content which should have the countdown
@@ -1445,18 +2015,14 @@ class BlackholePoolRecommender:
                         # Also try to get tooltip content which might have more info
                         try:
                             tooltip_text = elem.get_attribute('data-tooltip-content') or elem.get_attribute('title') or ""
-                        except:
+                        except WebDriverException:
                             tooltip_text = ""
                         
                         # Search in both the element text and tooltip
                         search_text = f"{time_text} {tooltip_text}"
                         
-                        # Extract countdown from the text
-                        now_utc = datetime.now(timezone.utc)
-                        delta = timedelta(0)
-                        
                         # Try format like "02d:08h:38m:35s" first (Xd:Xh:Xm:Xs)
-                        compact_format = re.search(r'(\d+)d\s*:\s*(\d+)h\s*:\s*(\d+)m\s*:\s*(\d+)s', search_text, re.IGNORECASE)
+                        compact_format = _RE_COUNTDOWN_COMPACT.search(search_text)
                         if compact_format:
                             days = int(compact_format.group(1))
                             hours = int(compact_format.group(2))
@@ -1465,7 +2031,7 @@ class BlackholePoolRecommender:
                             delta = timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
                         else:
                             # Try HH:MM:SS format
-                            time_match = re.search(r'(\d{1,2}):(\d{2}):(\d{2})', search_text)
+                            time_match = _RE_CLOCK.search(search_text)
                             if time_match:
                                 # HH:MM:SS format
                                 hours = int(time_match.group(1))
@@ -1473,21 +2039,8 @@ class BlackholePoolRecommender:
                                 seconds = int(time_match.group(3))
                                 delta = timedelta(hours=hours, minutes=minutes, seconds=seconds)
                             else:
-                                # Try to extract days, hours, minutes, seconds separately
-                                days_match = re.search(r'(\d+)\s*d(?:ays?)?\b', search_text, re.IGNORECASE)
-                                hours_match = re.search(r'(\d+)\s*h(?:ours?)?\b', search_text, re.IGNORECASE)
-                                minutes_match = re.search(r'(\d+)\s*m(?:inutes?)?\b', search_text, re.IGNORECASE)
-                                seconds_match = re.search(r'(\d+)\s*s(?:econds?)?\b', search_text, re.IGNORECASE)
-                                
-                                # Days/hours/minutes format
-                                if days_match:
-                                    delta += timedelta(days=int(days_match.group(1)))
-                                if hours_match:
-                                    delta += timedelta(hours=int(hours_match.group(1)))
-                                if minutes_match:
-                                    delta += timedelta(minutes=int(minutes_match.group(1)))
-                                if seconds_match:
-                                    delta += timedelta(seconds=int(seconds_match.group(1)))
+                                # Days/hours/minutes/seconds format
+                                delta = _parse_duration(search_text, _RE_DURATION_ABBR)
                         
                         if delta.total_seconds() > 0:
                             self.epoch_close_utc = now_utc + delta
@@ -1496,21 +2049,19 @@ class BlackholePoolRecommender:
             except Exception as e:
                 logger.debug(f"Error finding pending-time element: {e}")
             
+            # The remaining strategies search the page text; only read it now that Strategy 0 failed
+            page_text = self._get_page_text(driver)
+            
             # Strategy 1: Look for the specific pattern "Voting deadline for epoch #<number>"
             # This is typically followed by time remaining like "X days Y hours"
             # Try multiple patterns to catch variations in formatting
-            deadline_patterns = [
-                r'Voting\s+deadline\s+for\s+epoch\s*#\s*(\d+)[\s\n:]*([^\n]{0,200})',  # Flexible spacing and colon
-                r'Voting\s+deadline\s+for\s+epoch\s*#\s*(\d+)[\s\n]*([^\n]{0,200})',  # Without colon
-                r'Voting\s+deadline.*?epoch\s*#\s*(\d+)[\s\n:]*([^\n]{0,200})',  # More flexible
-                r'deadline.*?epoch\s*#\s*(\d+)[\s\n:]*([^\n]{0,200})',  # Without "Voting"
-            ]
-            
             deadline_match = None
             remaining_text = ""
             
-            for pattern in deadline_patterns:
-                deadline_match = re.search(pattern, page_text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+            # Every deadline pattern needs the word "deadline"; skip the scans on pages without it
+            has_deadline = 'deadline' in page_text.lower()
+            for pattern in _RE_DEADLINE_PATTERNS if has_deadline else ():
+                deadline_match = pattern.search(page_text)
                 if deadline_match:
                     # Extract the text after the deadline announcement (up to 200 chars)
                     remaining_text = deadline_match.group(2).strip() if len(deadline_match.groups()) > 1 else ""
@@ -1519,65 +2070,47 @@ class BlackholePoolRecommender:
             
             # If we found the deadline text but no remaining_text, look in nearby lines and elements
             if deadline_match and not remaining_text:
-                # Try to get text from nearby lines in page_text
+                # Try to get text from nearby lines in page_text (split once, reused below)
+                lines = page_text.split('\n')
+                deadline_signature = deadline_match.group(0).lower()
                 deadline_line_idx = None
-                for i, line in enumerate(page_text.split('\n')):
-                    if deadline_match.group(0).lower() in line.lower():
+                for i, line in enumerate(lines):
+                    if deadline_signature in line.lower():
                         deadline_line_idx = i
                         break
                 
                 if deadline_line_idx is not None:
-                    lines = page_text.split('\n')
                     # Check next few lines for countdown
                     for i in range(deadline_line_idx + 1, min(deadline_line_idx + 5, len(lines))):
-                        if re.search(r'\d+\s*(day|hour)', lines[i], re.IGNORECASE):
+                        if _RE_DAY_OR_HOUR.search(lines[i]):
                             remaining_text = lines[i]
                             break
                     # Also check previous line (sometimes it's before)
                     if not remaining_text and deadline_line_idx > 0:
-                        if re.search(r'\d+\s*(day|hour)', lines[deadline_line_idx - 1], re.IGNORECASE):
+                        if _RE_DAY_OR_HOUR.search(lines[deadline_line_idx - 1]):
                             remaining_text = lines[deadline_line_idx - 1]
                 
                 # Also try to get text from the element itself or nearby DOM elements
                 if not remaining_text:
                     try:
-                        deadline_elements = driver.find_elements(By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'voting deadline') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'deadline for epoch')]")
-                        for elem in deadline_elements:
-                            # Get parent element text which might contain the countdown
-                            try:
-                                parent = elem.find_element(By.XPATH, "./..")
-                                parent_text = parent.text
-                                if 'day' in parent_text.lower() or 'hour' in parent_text.lower():
-                                    remaining_text = parent_text
-                                    break
-                            except:
-                                try:
-                                    # Try getting next sibling
-                                    next_elem = driver.execute_script("return arguments[0].nextElementSibling;", elem)
-                                    if next_elem:
-                                        remaining_text = next_elem.text
-                                        if remaining_text:
-                                            break
-                                except:
-                                    pass
-                    except:
+                        # Parent text of the deadline label, which might contain the countdown
+                        parent_texts = driver.execute_script(
+                            _ELEMENT_TEXTS_CONTAINING_JS, ['voting deadline', 'deadline for epoch'], True
+                        ) or []
+                        for parent_text in parent_texts:
+                            if 'day' in (parent_lower := parent_text.lower()) or 'hour' in parent_lower:
+                                remaining_text = parent_text
+                                break
+                    except WebDriverException:
                         pass
             
             if deadline_match and remaining_text:
                 
                 # Look for time patterns in the remaining text
                 # Common formats: "X days Y hours", "X days", "X hours Y minutes", "HH:MM:SS"
-                now_utc = datetime.now(timezone.utc)
-                delta = timedelta(0)
-                
-                # Try to extract days, hours, minutes, seconds
-                days_match = re.search(r'(\d+)\s*days?', remaining_text, re.IGNORECASE)
-                hours_match = re.search(r'(\d+)\s*hours?', remaining_text, re.IGNORECASE)
-                minutes_match = re.search(r'(\d+)\s*minutes?', remaining_text, re.IGNORECASE)
-                seconds_match = re.search(r'(\d+)\s*seconds?', remaining_text, re.IGNORECASE)
                 
-                # Also try HH:MM:SS format
-                time_match = re.search(r'(\d{1,2}):(\d{2}):(\d{2})', remaining_text)
+                # HH:MM:SS format first, then days/hours/minutes/seconds
+                time_match = _RE_CLOCK.search(remaining_text)
                 
                 if time_match:
                     # HH:MM:SS format
@@ -1587,14 +2120,7 @@ class BlackholePoolRecommender:
                     delta = timedelta(hours=hours, minutes=minutes, seconds=seconds)
                 else:
                     # Days/hours/minutes format
-                    if days_match:
-                        delta += timedelta(days=int(days_match.group(1)))
-                    if hours_match:
-                        delta += timedelta(hours=int(hours_match.group(1)))
-                    if minutes_match:
-                        delta += timedelta(minutes=int(minutes_match.group(1)))
-                    if seconds_match:
-                        delta += timedelta(seconds=int(seconds_match.group(1)))
+                    delta = _parse_duration(remaining_text)
                 
                 if delta.total_seconds() > 0:
                     self.epoch_close_utc = now_utc + delta
@@ -1605,94 +2131,55 @@ class BlackholePoolRecommender:
             
             # Strategy 2: Fallback - look for date/time strings in UTC format
             # The page lists epoch close in UTC, so look for UTC timestamps
-            date_patterns = [
-                r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+UTC',  # ISO format with UTC
-                r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})\s+UTC',  # ISO format with UTC (no seconds)
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    # Try to parse the matches
-                    for match in reversed(matches[-5:]):  # Check last 5 matches
-                        try:
-                            parsed_date = None
-                            if match.count(':') == 2:
-                                parsed_date = datetime.strptime(match, '%Y-%m-%d %H:%M:%S')
-                            else:
-                                parsed_date = datetime.strptime(match, '%Y-%m-%d %H:%M')
-                            
-                            if parsed_date:
-                                # Set as UTC
-                                parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-                                # Only accept future dates (reasonable epoch close times)
-                                now_utc = datetime.now(timezone.utc)
-                                if parsed_date > now_utc:
-                                    self.epoch_close_utc = parsed_date
-                                    self.epoch_close_local = parsed_date.astimezone()
-                                    if not quiet:
-                                        print(f"Found epoch close time (UTC): {self.epoch_close_utc.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-                                    return
-                        except ValueError:
-                            continue
+            # (one scan; timestamps with seconds are tried before those without)
+            utc_dates = _RE_UTC_DATE.findall(page_text) if 'UTC' in page_text else []
+            for with_seconds in (True, False):
+                matches = [groups for groups in utc_dates if bool(groups[5]) == with_seconds]
+                # Try to parse the matches
+                for groups in reversed(matches[-5:]):  # Check last 5 matches
+                    try:
+                        # Built from the numeric groups directly (no strptime); invalid dates raise ValueError
+                        parsed_date = datetime(*(int(group or 0) for group in groups), tzinfo=timezone.utc)
+                    except ValueError:
+                        continue
+                    # Only accept future dates (reasonable epoch close times)
+                    if parsed_date > now_utc:
+                        self.epoch_close_utc = parsed_date
+                        self.epoch_close_local = parsed_date.astimezone()
+                        if not quiet:
+                            print(f"Found epoch close time (UTC): {self.epoch_close_utc.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+                        return
             
             # Strategy 3: Look for general countdown text if pattern not found
             # Look for elements containing "left", "ends", "remaining" near epoch info
             try:
-                # Search for any element with countdown-like text
-                countdown_xpath = (
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'day') and "
-                    "contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'hour')] | "
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'left')] | "
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'remaining')] | "
-                    "//*[regexp:test(text(), '\\d+:\\d{2}:\\d{2}')]"
-                )
-                
-                # Try simpler XPath without regex
-                countdown_elements = driver.find_elements(By.XPATH, 
-                    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'day') or "
-                    "contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'hour') or "
-                    "contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'left')]")
-                
-                # Also search in page_text for countdown patterns
+                # Search page_text for countdown patterns first; it is already in hand
                 if page_text:
                     # Look for patterns like "X days, Y hours" or "Xd Yh" in the full text
-                    countdown_in_text = re.search(r'(\d+)\s*d(?:ays?|\.)?[\s,]*(\d+)\s*h(?:ours?|\.)?', page_text, re.IGNORECASE)
+                    countdown_in_text = _RE_DAYS_HOURS.search(page_text)
                     if countdown_in_text:
                         days = int(countdown_in_text.group(1))
                         hours = int(countdown_in_text.group(2))
-                        now_utc = datetime.now(timezone.utc)
                         delta = timedelta(days=days, hours=hours)
                         if delta.total_seconds() > 0:
                             self.epoch_close_utc = now_utc + delta
                             self.epoch_close_local = self.epoch_close_utc.astimezone()
                             return
                 
-                for elem in countdown_elements:
-                    text = elem.text.strip()
+                # Then any element with countdown-like text, read in one script call
+                countdown_texts = driver.execute_script(_ELEMENT_TEXTS_CONTAINING_JS, ['day', 'hour', 'left'], False) or []
+                for text in countdown_texts:
                     # Look for time patterns like "HH:MM:SS" or "X days Y hours"
-                    if re.search(r'\d+:\d{2}:\d{2}', text) or re.search(r'\d+\s*(day|hour|minute)', text, re.IGNORECASE):
-                        now_utc = datetime.now(timezone.utc)
+                    if _RE_CLOCK.search(text) or _RE_DAY_HOUR_OR_MINUTE.search(text):
+                        time_match = _RE_CLOCK.search(text)
                         
-                        days_match = re.search(r'(\d+)\s*days?', text, re.IGNORECASE)
-                        hours_match = re.search(r'(\d+)\s*hours?', text, re.IGNORECASE)
-                        minutes_match = re.search(r'(\d+)\s*minutes?', text, re.IGNORECASE)
-                        
-                        time_match = re.search(r'(\d{1,2}):(\d{2}):(\d{2})', text)
-                        
-                        delta = timedelta(0)
                         if time_match:
                             hours = int(time_match.group(1))
                             minutes = int(time_match.group(2))
                             seconds = int(time_match.group(3))
                             delta = timedelta(hours=hours, minutes=minutes, seconds=seconds)
                         else:
-                            if days_match:
-                                delta += timedelta(days=int(days_match.group(1)))
-                            if hours_match:
-                                delta += timedelta(hours=int(hours_match.group(1)))
-                            if minutes_match:
-                                delta += timedelta(minutes=int(minutes_match.group(1)))
+                            delta = _parse_duration(text)
                         
                         if delta.total_seconds() > 0:
                             self.epoch_close_utc = now_utc + delta
@@ -1707,11 +2194,186 @@ class BlackholePoolRecommender:
             self.epoch_close_local = None
     
     def _extract_from_network_logs(self, driver) -> List[Pool]:
-        """Try to extract pool data from network request logs"""
+        """
+        Try to extract pool data from the JSON responses the page fetched.
+        
+        Reads Network.responseReceived events from Chrome's performance log
+        (enabled with the goog:loggingPrefs capability), pulls each JSON body
+        through CDP Network.getResponseBody and parses it like an API response.
+        Only pools with rewards and voting data (VAPR or votes) are kept, so
+        metadata-only lists such as the CL pool list do not count as a result.
+        """
         pools = []
+        try:
+            entries = driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"Performance log not available: {e}")
+            return pools
+        
+        for entry in entries:
+            try:
+                message = _json_loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            if message.get('method') != 'Network.responseReceived':
+                continue
+            params = message.get('params', {})
+            response = params.get('response', {})
+            if 'json' not in (response.get('mimeType') or ''):
+                continue
+            
+            try:
+                body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+                payload = body.get('body') or ''
+                if body.get('base64Encoded'):
+                    payload = base64.b64decode(payload)
+                data = _json_loads(payload)
+            except Exception as e:
+                # Body no longer buffered, not JSON, etc.
+                logger.debug(f"Could not read response body for {response.get('url')}: {e}")
+                continue
+            
+            if isinstance(data, list):
+                data = {'pools': data}
+            if not isinstance(data, dict):
+                continue
+            # Voting data only: CL pool-list entries carry trading fees but no VAPR or votes
+            pools = [
+                pool for pool in self._parse_api_response(data)
+                if pool.total_rewards > 0 and (pool.vapr > 0 or pool.current_votes is not None)
+            ]
+            if pools:
+                logger.debug(f"Found {len(pools)} pools in network response {response.get('url')}")
+                return pools
         
-        # This would require Chrome DevTools Protocol
-        # For now, return empty list
+        return pools
+    
+    def _parse_pools_from_markup(self, html: str) -> List[Pool]:
+        """
+        Parse pools from raw HTML, using BeautifulSoup when it is installed.
+        
+        The page is parsed with a SoupStrainer so only pool-bearing subtrees are
+        built: the vote page's pool rows first (read with the same row parser as
+        the live DOM), then table rows, then (only if nothing matched) pool cards.
+        """
+        if BS4_AVAILABLE:
+            _load_bs4()
+            soup = BeautifulSoup(html, _HTML_PARSER, parse_only=SoupStrainer('div', class_=_RE_POOL_ROW_CLASS))
+            pools = list(self._iter_pools_from_rows(self._harvest_pool_rows_from_soup(soup)))
+            if pools:
+                return pools
+            if LXML_AVAILABLE:
+                pools = self._parse_table_rows_lxml(html)
+            else:
+                soup = BeautifulSoup(html, _HTML_PARSER, parse_only=SoupStrainer('tr'))
+                pools = self._parse_pools_from_html(soup)
+            if pools:
+                return pools
+            soup = BeautifulSoup(html, _HTML_PARSER,
+                                 parse_only=SoupStrainer(['div', 'section'], class_=_RE_POOL_CLASS))
+            return self._parse_pools_from_html(soup)
+        return self._extract_pools_from_text(html)
+    
+    @staticmethod
+    def _harvest_pool_rows_from_soup(soup) -> List[dict]:
+        """
+        Read pool rows out of parsed HTML into the same fields _HARVEST_POOL_ROWS_JS
+        returns from the live page, so _parse_pool_row can handle both.
+        
+        Static markup has no computed styles, so 'opacity' is always None and
+        only inline-style opacity is seen.
+        """
+        def text(el):
+            return el.get_text('\n', strip=True) if el is not None else ''
+        
+        rows = []
+        for row in soup.select(_POOL_ROW_CSS):
+            right = row.select_one(_POOL_RIGHT_CSS)
+            id_element = row.select_one(_POOL_ID_ATTR_CSS)
+            tooltip = row.select_one(_POOL_ADDRESS_TOOLTIP_CSS)
+            pool_id = (row.get('data-pool-id') or row.get('data-pool-address') or
+                       row.get('data-address') or row.get('data-id'))
+            if not pool_id and id_element is not None:
+                pool_id = (id_element.get('data-pool-id') or id_element.get('data-pool-address') or
+                           id_element.get('data-address'))
+            if not pool_id:
+                pool_id = _find_address_in_soup(row)
+            name = text(row.select_one(_POOL_NAME_CSS))
+            rows.append({
+                'text': text(row),
+                'classes': ' '.join(row.get('class') or ()),
+                'style': row.get('style') or '',
+                'opacity': None,
+                'buttons': [
+                    [btn.get('data-tooltip-id') or '',
+                     btn.get('data-tooltip-content') or btn.get('title') or '']
+                    for btn in row.select(_POOL_BUTTON_CSS, limit=3)
+                ],
+                'name': name,
+                'left': '' if name else text(row.select_one(_POOL_LEFT_CSS)),
+                'fee': text(row.select_one(_POOL_FEE_CSS)),
+                'pool_id': pool_id,
+                'tooltip_id': tooltip.get('data-tooltip-id') if tooltip is not None else None,
+                'slots': [text(slot) for slot in right.select(_POOL_SLOT_CSS)] if right is not None else [],
+            })
+        return rows
+    
+    @staticmethod
+    def _is_pool_table_row(text: str) -> bool:
+        """Whether a table row's text looks like it contains pool data"""
+        # The row is lowercased at most once, and only when it has no '%'
+        return '$' in text and ('%' in text or 'vapr' in (text_lower := text.lower()) or 'reward' in text_lower)
+    
+    @staticmethod
+    def _pool_from_table_row(text: str, name_text: Optional[str]) -> Optional[Pool]:
+        """
+        Build a Pool from a table row's text and the text of its first cell.
+        
+        Returns None when the row has neither a recognizable name nor rewards;
+        raises ValueError if an amount cannot be parsed.
+        """
+        name = "Unknown"
+        # A match needs a '/' (pair) or uppercase letters (token); skip the regex otherwise
+        if name_text and ('/' in name_text or name_text.lower() != name_text):
+            name_match = _RE_PAIR_OR_TOKEN.search(name_text)
+            if name_match:
+                name = name_match.group(1)
+        
+        # Extract rewards
+        rewards_match = _RE_DOLLAR.search(text)
+        total_rewards = _parse_number(rewards_match.group(0)) if rewards_match else 0.0
+        
+        # Extract VAPR
+        vapr_match = _RE_VAPR.search(text) if '%' in text else None
+        vapr = _parse_number(vapr_match.group(1)) if vapr_match else 0.0
+        
+        if name != "Unknown" or total_rewards > 0:
+            return Pool(name=name, total_rewards=total_rewards, vapr=vapr)
+        return None
+    
+    def _parse_table_rows_lxml(self, html: str) -> List[Pool]:
+        """
+        Strategy 1 of _parse_pools_from_html (table rows), run on an lxml tree.
+        
+        Rows and cells are walked by libxml2 directly instead of through a
+        BeautifulSoup tree built on top of the same parser.
+        """
+        if not html:
+            return []
+        _load_lxml()
+        pools = []
+        for row in lxml_html.fromstring(html).iter('tr'):
+            # Same text as get_text(' ', strip=True): stripped, non-empty strings joined by spaces
+            text = ' '.join(filter(None, (chunk.strip() for chunk in row.itertext())))
+            if self._is_pool_table_row(text):
+                name_cells = _table_row_name_cell(row)
+                name_text = ''.join(chunk.strip() for chunk in name_cells[0].itertext()) if name_cells else None
+                try:
+                    pool = self._pool_from_table_row(text, name_text)
+                except ValueError:
+                    continue
+                if pool:
+                    pools.append(pool)
         return pools
     
     def _parse_pools_from_html(self, soup) -> List[Pool]:
@@ -1723,57 +2385,39 @@ class BlackholePoolRecommender:
         # Strategy 1: Look for table rows
         table_rows = soup.find_all('tr')
         for row in table_rows:
-            text = row.get_text()
-            # Check if this row looks like it contains pool data
-            if '$' in text and ('%' in text or 'vapr' in text.lower() or 'reward' in text.lower()):
+            # Join cells with a space so adjacent cells ("$1,234.5" + "55.5%") don't run together
+            text = row.get_text(' ', strip=True)
+            if self._is_pool_table_row(text):
+                # Usually name is in first cell (find() stops at it instead of listing every cell)
+                name_cell = row.find(['td', 'th', 'div', 'span'])
                 try:
-                    # Extract pool name
-                    name = "Unknown"
-                    name_cells = row.find_all(['td', 'th', 'div', 'span'])
-                    if name_cells:
-                        # Usually name is in first cell
-                        name_text = name_cells[0].get_text(strip=True)
-                        name_match = re.search(r'([A-Z0-9\.]+/[A-Z0-9\.]+|[A-Z]{2,})', name_text)
-                        if name_match:
-                            name = name_match.group(1)
-                    
-                    # Extract rewards
-                    rewards_match = re.search(r'\$[\d,]+\.?\d*', text)
-                    total_rewards = float(rewards_match.group(0).replace('$', '').replace(',', '')) if rewards_match else 0.0
-                    
-                    # Extract VAPR
-                    vapr_match = re.search(r'([\d,]+\.?\d*)\s*%', text)
-                    vapr = float(vapr_match.group(1).replace(',', '')) if vapr_match else 0.0
-                    
-                    if name != "Unknown" or total_rewards > 0:
-                        pools.append(Pool(
-                            name=name,
-                            total_rewards=total_rewards,
-                            vapr=vapr
-                        ))
-                except:
+                    pool = self._pool_from_table_row(text, name_cell.get_text(strip=True) if name_cell else None)
+                except ValueError:
                     continue
+                if pool:
+                    pools.append(pool)
         
         # Strategy 2: Look for divs with pool-like classes
         if not pools:
-            pool_divs = soup.find_all(['div', 'section'], class_=re.compile(r'pool|row|card|item', re.I))
+            pool_divs = soup.select(_POOL_CARD_CSS)
             for div in pool_divs:
-                text = div.get_text()
+                text = div.get_text(' ', strip=True)
                 if '$' in text:
                     try:
                         name = "Unknown"
-                        name_elem = div.find(class_=re.compile(r'name|token|pair', re.I))
+                        name_elem = div.select_one(_POOL_CARD_NAME_CSS)
                         if name_elem:
                             name_text = name_elem.get_text(strip=True)
-                            name_match = re.search(r'([A-Z0-9\.]+/[A-Z0-9\.]+)', name_text)
+                            # Pair names always contain '/'; skip the regex otherwise
+                            name_match = _RE_PAIR.search(name_text) if '/' in name_text else None
                             if name_match:
                                 name = name_match.group(1)
                         
-                        rewards_match = re.search(r'\$[\d,]+\.?\d*', text)
-                        total_rewards = float(rewards_match.group(0).replace('$', '').replace(',', '')) if rewards_match else 0.0
+                        rewards_match = _RE_DOLLAR.search(text)
+                        total_rewards = _parse_number(rewards_match.group(0)) if rewards_match else 0.0
                         
-                        vapr_match = re.search(r'([\d,]+\.?\d*)\s*%', text)
-                        vapr = float(vapr_match.group(1).replace(',', '')) if vapr_match else 0.0
+                        vapr_match = _RE_VAPR.search(text) if '%' in text else None
+                        vapr = _parse_number(vapr_match.group(1)) if vapr_match else 0.0
                         
                         if total_rewards > 0:
                             pools.append(Pool(
@@ -1781,7 +2425,7 @@ class BlackholePoolRecommender:
                                 total_rewards=total_rewards,
                                 vapr=vapr
                             ))
-                    except:
+                    except ValueError:
                         continue
         
         return pools
@@ -1791,65 +2435,60 @@ class BlackholePoolRecommender:
         pools = []
         
         # Look for JSON data embedded in the page
-        json_patterns = [
-            r'\{.*?"pools".*?\}',
-            r'\"pools\"\s*:\s*\[.*?\]',
-            r'window\.__INITIAL_STATE__\s*=\s*(\{.*?\});',
-            r'window\.__APOLLO_STATE__\s*=\s*(\{.*?\});',
-        ]
-        
-        for pattern in json_patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            for match in matches:
-                try:
-                    import json
-                    if isinstance(match, tuple):
-                        match = match[0]
-                    data = json.loads(match)
-                    # Try to find pools in the JSON structure
-                    if isinstance(data, dict):
-                        pools_data = data.get('pools', data.get('data', {}).get('pools', []))
-                        if pools_data:
-                            for pool_data in pools_data:
-                                if isinstance(pool_data, dict):
-                                    pool = Pool(
-                                        name=pool_data.get('name', pool_data.get('pair', 'Unknown')),
-                                        total_rewards=float(pool_data.get('totalRewards', pool_data.get('total_rewards', 0))),
-                                        vapr=float(pool_data.get('vapr', pool_data.get('VAPR', 0))),
-                                        current_votes=float(pool_data.get('votes', 0)) if pool_data.get('votes') else None
-                                    )
-                                    pools.append(pool)
-                    return pools
-                except:
-                    continue
+        for match in _iter_json_candidates(text):
+            try:
+                data = _json_loads(match)
+                # Try to find pools in the JSON structure
+                if isinstance(data, dict):
+                    pools_data = data.get('pools', data.get('data', {}).get('pools', []))
+                    if pools_data:
+                        for pool_data in pools_data:
+                            if isinstance(pool_data, dict):
+                                pool = Pool(
+                                    name=pool_data.get('name', pool_data.get('pair', 'Unknown')),
+                                    total_rewards=float(pool_data.get('totalRewards', pool_data.get('total_rewards', 0))),
+                                    vapr=float(pool_data.get('vapr', pool_data.get('VAPR', 0))),
+                                    current_votes=float(pool_data.get('votes', 0)) if pool_data.get('votes') else None
+                                )
+                                pools.append(pool)
+                return pools
+            except (ValueError, TypeError, AttributeError):
+                continue
         
         # If no JSON found, try to extract from structured text patterns
         # Look for lines that contain both $ and % (likely pool data)
-        lines = text.split('\n')
         current_pool = None
         
-        for line in lines:
+        for line in _iter_lines(text):
+            # Most lines carry none of the markers; skip them without a regex
+            if '$' not in line and '%' not in line and '/' not in line:
+                continue
+            
+            # First pair, dollar amount and percentage on the line, in one scan
+            found = {}
+            for match in _RE_LINE.finditer(line):
+                found.setdefault(match.lastgroup, match.group(match.lastgroup))
+                if len(found) == 3:
+                    break
+            
             # Look for pool name patterns
-            name_match = re.search(r'([A-Z0-9\.]+/[A-Z0-9\.]+)', line)
-            if name_match:
+            if 'pair' in found:
                 if current_pool:
                     pools.append(current_pool)
                 current_pool = Pool(
-                    name=name_match.group(1),
+                    name=found['pair'],
                     total_rewards=0.0,
                     vapr=0.0
                 )
             
             if current_pool:
                 # Extract rewards
-                rewards_match = re.search(r'\$[\d,]+\.?\d*', line)
-                if rewards_match:
-                    current_pool.total_rewards = float(rewards_match.group(0).replace('$', '').replace(',', ''))
+                if 'dollars' in found:
+                    current_pool.total_rewards = _parse_number(found['dollars'])
                 
                 # Extract VAPR
-                vapr_match = re.search(r'([\d,]+\.?\d*)\s*%', line)
-                if vapr_match:
-                    current_pool.vapr = float(vapr_match.group(1).replace(',', ''))
+                if 'pct' in found:
+                    current_pool.vapr = _parse_number(found['pct'])
         
         if current_pool:
             pools.append(current_pool)
@@ -1880,17 +2519,13 @@ class BlackholePoolRecommender:
             # Keep only the known working endpoint
         ]
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        }
-        
         for endpoint in api_endpoints:
             try:
                 # Use shorter timeout to fail fast if endpoint is slow
-                response = requests.get(endpoint, headers=headers, timeout=5)
+                response = self._session.get(endpoint, timeout=5)
                 if response.status_code == 200:
-                    data = response.json()
+                    # Decode the raw bytes directly (orjson when available)
+                    data = _json_loads(response.content)
                     pools = self._parse_api_response(data)
                     if pools:
                         return pools
@@ -1932,29 +2567,9 @@ class BlackholePoolRecommender:
                     token1_symbol = pool_data['token1'].get('symbol', 'Unknown')
                     pool_name = f"{token0_symbol}/{token1_symbol}"
                     
-                    # Determine pool type from fee tier
+                    # Determine pool type from fee tier (unknown tiers default to CL200)
                     fee = int(pool_data.get('fee', '0'))
-                    if fee == 100:  # 0.01%
-                        pool_type = 'CL1'
-                        fee_pct = '0.01%'
-                    elif fee == 500:  # 0.05%
-                        pool_type = 'CL200'
-                        fee_pct = '0.05%'
-                    elif fee == 2500:  # 0.25%
-                        pool_type = 'CL200'
-                        fee_pct = '0.25%'
-                    elif fee == 5000:  # 0.5%
-                        pool_type = 'CL200'
-                        fee_pct = '0.5%'
-                    elif fee == 7000:  # 0.7%
-                        pool_type = 'CL200'
-                        fee_pct = '0.7%'
-                    elif fee == 10000:  # 1%
-                        pool_type = 'CL200'
-                        fee_pct = '1%'
-                    else:
-                        pool_type = 'CL200'  # Default
-                        fee_pct = f"{fee/10000}%"
+                    pool_type, fee_pct = _CL_FEE_TIERS.get(fee) or ('CL200', f"{fee/10000}%")
                     
                     # Use feesUSD as proxy for total_rewards (not perfect, but available)
                     # Note: This is trading fees, not voting rewards
@@ -2084,90 +2699,72 @@ class BlackholePoolRecommender:
         if not quiet:
             print(f"Found {len(pools)} pools")
         
-        # Filter out vAMM pools if requested
+        # Filters as (keep predicate, message for the pools it drops), in the order
+        # they are reported
+        filters = []
         if hide_vamm:
-            original_count = len(pools)
-            pools = [p for p in pools if p.pool_type != 'vAMM']
-            filtered_count = original_count - len(pools)
-            if filtered_count > 0 and not quiet:
-                print(f"Filtered out {filtered_count} vAMM pool(s)")
+            filters.append((lambda p: p.pool_type != 'vAMM', "vAMM pool(s)"))
         
         # Filter out pools below minimum rewards threshold
         if min_rewards is not None:
-            original_count = len(pools)
-            pools = [p for p in pools if p.total_rewards >= min_rewards]
-            filtered_count = original_count - len(pools)
-            if filtered_count > 0 and not quiet:
-                print(f"Filtered out {filtered_count} pool(s) with total rewards < ${min_rewards:,.2f}")
+            filters.append((lambda p: p.total_rewards >= min_rewards,
+                            f"pool(s) with total rewards < ${min_rewards:,.2f}"))
         
         # Filter pools by name using shell-style wildcards (case-insensitive)
         if pool_name is not None:
-            original_count = len(pools)
             # If pattern doesn't contain wildcards, wrap it with *pattern* for contains matching
             pattern = pool_name
             if '*' not in pattern and '?' not in pattern:
                 pattern = f"*{pattern}*"
-            
-            # Use fnmatch for shell-style wildcard matching (case-insensitive)
-            filtered_pools = []
-            for pool in pools:
-                # Case-insensitive matching: convert both pool name and pattern to lowercase
-                if fnmatch.fnmatch(pool.name.lower(), pattern.lower()):
-                    filtered_pools.append(pool)
-            pools = filtered_pools
-            filtered_count = original_count - len(pools)
-            if filtered_count > 0 and not quiet:
-                print(f"Filtered out {filtered_count} pool(s) that don't match pattern '{pool_name}'")
+            # Translated to a regex once (what fnmatch does per call); both sides lowercased
+            name_match = re.compile(fnmatch.translate(pattern.lower())).match
+            filters.append((lambda p: name_match(p.name.lower()) is not None,
+                            f"pool(s) that don't match pattern '{pool_name}'"))
         
         # Filter out pools where user would exceed max pool percentage threshold
         if max_pool_percentage is not None and user_voting_power is not None:
-            original_count = len(pools)
-            filtered_pools = []
-            for pool in pools:
-                # Skip pools without vote data (can't calculate percentage)
+            def within_max_percentage(pool: Pool) -> bool:
+                # Pools without vote data would give the user 100%
                 if pool.current_votes is None or pool.current_votes == 0:
-                    # If pool has no votes, user would have 100% - include only if threshold allows
-                    if max_pool_percentage >= 100.0:
-                        filtered_pools.append(pool)
-                    # Otherwise filter it out
-                    continue
-                
-                # Calculate new total votes after user votes
-                new_total_votes = pool.current_votes + user_voting_power
-                # Calculate user's percentage of the pool
-                user_percentage = (user_voting_power / new_total_votes) * 100
-                
-                # Include pool only if user percentage is <= threshold
-                if user_percentage <= max_pool_percentage:
-                    filtered_pools.append(pool)
-            
-            pools = filtered_pools
-            filtered_count = original_count - len(pools)
-            if filtered_count > 0 and not quiet:
-                print(f"Filtered out {filtered_count} pool(s) where your voting power would exceed {max_pool_percentage}% of total pool votes")
-        
-        # Calculate profitability scores (for display purposes)
-        for pool in pools:
-            pool_score = pool.profitability_score()
+                    return max_pool_percentage >= 100.0
+                # User's percentage of the pool after adding their votes
+                user_percentage = (user_voting_power / (pool.current_votes + user_voting_power)) * 100
+                return user_percentage <= max_pool_percentage
+            filters.append((within_max_percentage,
+                            f"pool(s) where your voting power would exceed {max_pool_percentage}% of total pool votes"))
+        
+        # One pass over the pools; each dropped pool is counted against the first filter
+        # that rejects it, the same counts as filtering the list once per criterion
+        if filters:
+            dropped = [0] * len(filters)
+            kept = []
+            for pool in pools:
+                for index, (keep, _) in enumerate(filters):
+                    if not keep(pool):
+                        dropped[index] += 1
+                        break
+                else:
+                    kept.append(pool)
+            pools = kept
+            if not quiet:
+                for count, (_, message) in zip(dropped, filters):
+                    if count > 0:
+                        print(f"Filtered out {count} {message}")
         
-        # Sort by estimated reward if voting power provided, otherwise by profitability score
+        # Rank by estimated reward if voting power provided, otherwise by profitability score
+        # (the key is evaluated once per pool, so scores are not recomputed per comparison)
         if user_voting_power is not None:
-            sorted_pools = sorted(
-                pools, 
-                key=lambda p: p.estimate_user_rewards(user_voting_power), 
-                reverse=True
-            )
+            sort_key = lambda p: p.estimate_user_rewards(user_voting_power)
         else:
-            sorted_pools = sorted(
-                pools, 
-                key=lambda p: p.profitability_score(), 
-                reverse=True
-            )
+            sort_key = Pool.profitability_score
         
         # Store initial pool count in instance variable for error reporting
         self._initial_pool_count = initial_pool_count
         
-        return sorted_pools[:top_n]
+        if top_n >= 0:
+            # Partial selection in O(N log top_n); same order (ties included) as sorted(...)[:top_n]
+            return heapq.nlargest(top_n, pools, key=sort_key)
+        return sorted(pools, key=sort_key, reverse=True)[:top_n]
     
     def generate_voting_script(self, pools: List[Pool], quiet: bool = False) -> Optional[str]:
         """
@@ -2360,13 +2957,9 @@ class BlackholePoolRecommender:
         Returns:
             Bookmarklet instructions with URL
         """
-        from urllib.parse import quote
-        import os
-        
         # Extract pool data from the JS code
-        import re
-        pool_ids_match = re.search(r'const poolAddresses = (\[.*?\]);', js_code, re.DOTALL)
-        pool_info_match = re.search(r'const poolInfo = (\{.*?\});', js_code, re.DOTALL)
+        pool_ids_match = _RE_JS_POOL_ADDRESSES.search(js_code)
+        pool_info_match = _RE_JS_POOL_INFO.search(js_code)
         
         if pool_ids_match and pool_info_match:
             # Create a loader bookmarklet that reads from the data file
@@ -2378,7 +2971,6 @@ class BlackholePoolRecommender:
                 data_file = 'blackhole_pools_data.js'
             
             # Create the data file with pool information
-            from datetime import datetime
             data_file_content = f"""// Blackhole Pool Selection Data
 // This file is automatically updated when you run the recommender
 // Last updated: {datetime.now().isoformat()}
@@ -2488,7 +3080,7 @@ window.BLACKHOLE_POOL_DATA = {{
 """
             
             # Clean and encode the loader
-            loader_code = re.sub(r'\s+', ' ', loader_code.strip())
+            loader_code = _RE_WHITESPACE_RUN.sub(' ', loader_code.strip())
             encoded_loader = quote(loader_code, safe='')
             bookmarklet_url = f"javascript:{encoded_loader}"
             
@@ -2510,7 +3102,6 @@ window.BLACKHOLE_POOL_DATA = {{
 """
         else:
             # Fallback to static bookmarklet if we can't extract data
-            import re
             lines = js_code.split('\n')
             cleaned_lines = []
             for line in lines:
@@ -2525,8 +3116,8 @@ window.BLACKHOLE_POOL_DATA = {{
                     cleaned_lines.append(line)
             
             js_code = '\n'.join(cleaned_lines)
-            js_code = re.sub(r'/\*.*?\*/', '', js_code, flags=re.DOTALL)
-            js_code = re.sub(r'\s+', ' ', js_code)
+            js_code = _RE_JS_BLOCK_COMMENT.sub('', js_code)
+            js_code = _RE_WHITESPACE_RUN.sub(' ', js_code)
             js_code = js_code.strip()
             
             encoded_js = quote(js_code, safe='')
@@ -2552,6 +3143,7 @@ window.BLACKHOLE_POOL_DATA = {{
         """
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium is required. Install with: pip install selenium")
+        _load_selenium()
         
         if not pools:
             if not quiet:
@@ -2571,11 +3163,12 @@ window.BLACKHOLE_POOL_DATA = {{
         options.add_argument('--window-size=1920,1080')
         options.add_argument('user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         options.add_argument('--page-load-strategy=eager')
+        options.add_argument('--log-level=3')
         
         driver = None
         try:
             driver = webdriver.Chrome(options=options)
-            driver.implicitly_wait(10)
+            driver.implicitly_wait(0)
             driver.set_page_load_timeout(60)
             
             if not quiet:
@@ -2584,27 +3177,35 @@ window.BLACKHOLE_POOL_DATA = {{
             
             if not quiet:
                 print("Waiting for pool data to load (this may take 15-20 seconds)...")
-            time.sleep(12)  # Give React time to render
+            # Wait for React to render the first pool row instead of a fixed delay
+            try:
+                WebDriverWait(driver, 25).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _POOL_ROW_CSS))
+                )
+            except TimeoutException:
+                if not quiet:
+                    print("Timed out waiting for pool rows; continuing anyway")
             
             # Set pagination to show 100 pools per page (to make finding pools easier)
             try:
-                pagination_containers = WebDriverWait(driver, 5).until(
-                    EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'size-per-page')]"))
+                pagination_containers = WebDriverWait(driver, self.implicit_wait).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, _PAGE_SIZE_CSS))
                 )
                 if pagination_containers:
                     pagination_container = pagination_containers[0]
                     driver.execute_script("arguments[0].click();", pagination_container)
-                    time.sleep(1.5)
                     
+                    # The explicit wait below returns as soon as the dropdown options render
                     option_100s = WebDriverWait(driver, 3).until(
                         EC.presence_of_all_elements_located((By.XPATH, "//span[contains(@class, 'size-text') and contains(text(), '100')]"))
                     )
                     if option_100s:
                         option_100 = option_100s[0]
-                        parent_containers = option_100.find_elements(By.XPATH, "./ancestor::*[contains(@class, 'size-container')][1]")
-                        if parent_containers:
-                            driver.execute_script("arguments[0].click();", parent_containers[0])
-                            time.sleep(4)
+                        parent_container = driver.execute_script(_SIZE_CONTAINER_JS, option_100)
+                        if parent_container:
+                            rows_before = driver.execute_script(_POOL_COUNT_JS) or 0
+                            driver.execute_script("arguments[0].click();", parent_container)
+                            self._wait_for_pool_count_stable(driver, 100, rows_before, timeout=4)
             except Exception as e:
                 if not quiet:
                     logger.debug(f"Could not set pagination: {e}")
@@ -2612,107 +3213,61 @@ window.BLACKHOLE_POOL_DATA = {{
             # Scroll to load all pools
             pool_container = None
             try:
-                pool_container = driver.find_element(By.XPATH, "//div[contains(@class, 'pools-container')] | //div[contains(@class, 'pool-section')]")
-            except:
+                pool_container = driver.execute_script(_POOLS_CONTAINER_JS)
+            except WebDriverException:
                 pass
             
-            # Scroll multiple times to load all pools
+            # Scroll multiple times to load all pools (stop early once no new rows appear)
+            loaded_count = driver.execute_script(_POOL_COUNT_JS) or 0
             for _ in range(5):
-                if pool_container:
-                    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", pool_container)
-                else:
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                current_count = self._scroll_and_wait_for_rows(driver, pool_container, loaded_count)
+                if current_count <= loaded_count:
+                    break
+                loaded_count = current_count
             
             # Scroll back to top
             if pool_container:
                 driver.execute_script("arguments[0].scrollTop = 0", pool_container)
             else:
                 driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            self._wait_for_pool_count_above(driver, 0, timeout=2)
             
-            # Find and select each recommended pool
+            # Find and select each recommended pool. Rows and their names are read
+            # once for all pools (one round-trip) rather than per pool per row.
             selected_count = 0
-            pool_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'liquidity-pool-cell') and (contains(@class, 'even') or contains(@class, 'odd'))]")
+            pool_rows = driver.execute_script(_POOL_ROW_NAMES_JS) or []
             
             if not quiet:
-                print(f"\nFound {len(pool_elements)} pools on page. Selecting recommended pools...")
+                print(f"\nFound {len(pool_rows)} pools on page. Selecting recommended pools...")
             
             for pool in pools:
                 pool_found = False
                 
                 # Try to find pool by name
-                for element in pool_elements:
-                    try:
-                        # Get the pool name from the element
-                        name_elements = element.find_elements(By.XPATH, ".//div[contains(@class, 'name')]")
-                        if name_elements:
-                            element_name = name_elements[0].text.strip()
-                            
-                            # Match pool name (exact or contains)
-                            if element_name == pool.name or pool.name in element_name or element_name in pool.name:
-                                pool_found = True
-                                
-                                # Look for checkbox or selection button
-                                # Try multiple strategies to find the select/checkbox element
-                                
-                                # Strategy 1: Look for checkbox input
-                                checkboxes = element.find_elements(By.XPATH, ".//input[@type='checkbox']")
-                                if checkboxes:
-                                    checkbox = checkboxes[0]
-                                    if not checkbox.is_selected():
-                                        driver.execute_script("arguments[0].click();", checkbox)
-                                        selected_count += 1
-                                        if not quiet:
-                                            print(f"  [OK] Selected: {pool.name}")
-                                    else:
-                                        if not quiet:
-                                            print(f"  [OK] Already selected: {pool.name}")
-                                    break
-                                
-                                # Strategy 2: Look for clickable div/button with select-related classes
-                                select_buttons = element.find_elements(By.XPATH, 
-                                    ".//div[contains(@class, 'checkbox')] | "
-                                    ".//div[contains(@class, 'select')] | "
-                                    ".//button[contains(@class, 'select')] | "
-                                    ".//div[@role='checkbox']"
-                                )
-                                if select_buttons:
-                                    select_button = select_buttons[0]
-                                    driver.execute_script("arguments[0].click();", select_button)
-                                    selected_count += 1
-                                    if not quiet:
-                                        print(f"  [OK] Selected: {pool.name}")
-                                    break
-                                
-                                # Strategy 3: Look for the left section and click it (often contains checkbox)
-                                left_sections = element.find_elements(By.XPATH, ".//div[contains(@class, 'liquidity-pool-cell-left')]")
-                                if left_sections:
-                                    left_section = left_sections[0]
-                                    # Try clicking on the left section (may contain checkbox)
-                                    driver.execute_script("arguments[0].click();", left_section)
-                                    time.sleep(0.5)  # Wait for selection to register
-                                    selected_count += 1
-                                    if not quiet:
-                                        print(f"  [OK] Selected: {pool.name}")
-                                    break
-                                
-                                # Strategy 4: Click anywhere on the pool row (if it's clickable)
-                                try:
-                                    driver.execute_script("arguments[0].click();", element)
-                                    time.sleep(0.5)
-                                    selected_count += 1
-                                    if not quiet:
-                                        print(f"  [OK] Selected: {pool.name}")
-                                    break
-                                except:
-                                    pass
-                                
-                                break
-                    except Exception as e:
-                        if not quiet:
-                            logger.debug(f"Error selecting pool {pool.name}: {e}")
+                for element, element_name in pool_rows:
+                    if not element_name:
                         continue
+                    # Match pool name (exact or contains)
+                    if element_name == pool.name or pool.name in element_name or element_name in pool.name:
+                        pool_found = True
+                        try:
+                            # Checkbox, select button, left section or the row itself - tried in
+                            # the page in one call (see _SELECT_POOL_ROW_JS)
+                            status = driver.execute_script(_SELECT_POOL_ROW_JS, element)
+                        except Exception as e:
+                            if not quiet:
+                                logger.debug(f"Error selecting pool {pool.name}: {e}")
+                            continue
+                        if status == 'already':
+                            if not quiet:
+                                print(f"  [OK] Already selected: {pool.name}")
+                        elif status:
+                            if status == 'clicked':
+                                time.sleep(0.5)  # Wait for selection to register
+                            selected_count += 1
+                            if not quiet:
+                                print(f"  [OK] Selected: {pool.name}")
+                        break
                 
                 if not pool_found and not quiet:
                     print(f"  [X] Could not find pool on page: {pool.name}")
@@ -2747,14 +3302,13 @@ window.BLACKHOLE_POOL_DATA = {{
         except Exception as e:
             if not quiet:
                 print(f"\nError opening voting page: {e}")
-                import traceback
                 traceback.print_exc()
             if driver:
                 driver.quit()
             raise
     
-    def print_recommendations(self, pools: List[Pool], user_voting_power: Optional[float] = None, hide_vamm: bool = False, min_rewards: Optional[float] = None, max_pool_percentage: Optional[float] = None, output_json: bool = False, return_output: bool = False, single_line: bool = False):
-        """Print formatted recommendations"""
+    def print_recommendations(self, pools: List[Pool], user_voting_power: Optional[float] = None, hide_vamm: bool = False, min_rewards: Optional[float] = None, max_pool_percentage: Optional[float] = None, output_json: bool = False, return_output: bool = False, single_line: bool = False, pretty_json: bool = True):
+        """Print formatted recommendations (pretty_json=False emits compact JSON for machine consumers)"""
         if not pools:
             if return_output:
                 return "No pools to recommend."
@@ -2762,7 +3316,7 @@ window.BLACKHOLE_POOL_DATA = {{
             return None
         
         if output_json:
-            output = self._get_json_output(pools, user_voting_power, hide_vamm, min_rewards, max_pool_percentage)
+            output = self._get_json_output(pools, user_voting_power, hide_vamm, min_rewards, max_pool_percentage, pretty=pretty_json)
             if return_output:
                 return output
             print(output)
@@ -2798,12 +3352,13 @@ window.BLACKHOLE_POOL_DATA = {{
         if single_line and user_voting_power:
             # Calculate maximum length of pool name prefix (number + pool name + ": ")
             # and maximum length of dollar amount to align both
+            # Estimated rewards are computed once here and reused for the output lines
             max_prefix_length = 0
             max_dollar_length = 0
-            for i, pool in enumerate(pools, 1):
+            estimated_rewards = [pool.estimate_user_rewards(user_voting_power) for pool in pools]
+            for i, (pool, estimated_reward) in enumerate(zip(pools, estimated_rewards), 1):
                 prefix = f"{i}. {pool.name}: "
                 max_prefix_length = max(max_prefix_length, len(prefix))
-                estimated_reward = pool.estimate_user_rewards(user_voting_power)
                 dollar_str = f"${estimated_reward:,.2f}"
                 max_dollar_length = max(max_dollar_length, len(dollar_str))
         
@@ -2811,7 +3366,7 @@ window.BLACKHOLE_POOL_DATA = {{
             if single_line:
                 # Single-line format: pool name and estimated reward only
                 if user_voting_power:
-                    estimated_reward = pool.estimate_user_rewards(user_voting_power)
+                    estimated_reward = estimated_rewards[i - 1]
                     new_total_votes = (pool.current_votes or 0) + user_voting_power
                     user_share_pct = (user_voting_power / new_total_votes * 100) if new_total_votes > 0 else 0
                     # Pad the prefix to align the dollar amounts
@@ -2831,12 +3386,7 @@ window.BLACKHOLE_POOL_DATA = {{
                 output_lines.append(f"{i}. {pool.name}")
                 if pool.pool_type:
                     # Convert pool type to human-readable format
-                    type_name_map = {
-                        'CL200': 'Concentrated Liquidity, 200x',
-                        'CL1': 'Concentrated Liquidity, 1x',
-                        'vAMM': 'Virtual AMM'
-                    }
-                    human_readable_type = type_name_map.get(pool.pool_type, pool.pool_type)
+                    human_readable_type = _TYPE_NAME_MAP.get(pool.pool_type, pool.pool_type)
                     type_info = f" {human_readable_type} ({pool.pool_type})"
                     if pool.fee_percentage:
                         type_info += f" {pool.fee_percentage}"
@@ -2865,10 +3415,8 @@ window.BLACKHOLE_POOL_DATA = {{
             print(output_text)
             return None
     
-    def _get_json_output(self, pools: List[Pool], user_voting_power: Optional[float] = None, hide_vamm: bool = False, min_rewards: Optional[float] = None, max_pool_percentage: Optional[float] = None) -> str:
-        """Get recommendations as JSON string"""
-        from datetime import datetime
-        
+    def _get_json_output(self, pools: List[Pool], user_voting_power: Optional[float] = None, hide_vamm: bool = False, min_rewards: Optional[float] = None, max_pool_percentage: Optional[float] = None, pretty: bool = True) -> str:
+        """Get recommendations as JSON string (indented when pretty, compact otherwise)"""
         output = {
             "version": __version__,
             "generated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -2921,7 +3469,7 @@ window.BLACKHOLE_POOL_DATA = {{
             
             output["pools"].append(pool_data)
         
-        return json.dumps(output, indent=2)
+        return _json_dumps(output, pretty=pretty)
     
     def _print_json_output(self, pools: List[Pool], user_voting_power: Optional[float] = None):
         """Print recommendations as JSON (legacy method for backward compatibility)"""
@@ -2967,6 +3515,13 @@ def main():
         action='store_true',
         help='Skip cache and fetch fresh data (will still refresh the cache with new data)'
     )
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=None,
+        metavar='MINUTES',
+        help='Treat cached pool data as fresh for this many minutes (overrides cache.expiry_minutes in config.yaml)'
+    )
     parser.add_argument(
         '--cache-info',
         action='store_true',
@@ -3022,6 +3577,9 @@ def main():
     
     args = parser.parse_args()
     
+    if args.cache_ttl is not None and args.cache_ttl <= 0:
+        parser.error("--cache-ttl must be a positive number of minutes")
+    
     # Handle --clear-cache flag
     if args.clear_cache:
         recommender = BlackholePoolRecommender()
@@ -3035,7 +3593,7 @@ def main():
     
     # Handle --cache-info flag
     if args.cache_info:
-        recommender = BlackholePoolRecommender()
+        recommender = BlackholePoolRecommender(cache_expiry_minutes=args.cache_ttl)
         cache_info = recommender._get_cache_info()
         
         if cache_info:
@@ -3139,7 +3697,7 @@ def main():
         # Use config default for headless, but CLI flag can override
         # If --no-headless is set, force headless=False; otherwise use config default
         headless_param = False if args.no_headless else None
-        recommender = BlackholePoolRecommender(headless=headless_param, no_cache=args.no_cache)
+        recommender = BlackholePoolRecommender(headless=headless_param, no_cache=args.no_cache, cache_expiry_minutes=args.cache_ttl)
         recommendations = recommender.recommend_pools(top_n=args.top, user_voting_power=args.voting_power, hide_vamm=args.hide_vamm, min_rewards=args.min_rewards, max_pool_percentage=args.max_pool_percentage, pool_name=args.pool_name, quiet=args.json or args.output)
         
         if not recommendations:
@@ -3175,7 +3733,9 @@ def main():
             max_pool_percentage=args.max_pool_percentage,
             output_json=args.json,
             return_output=bool(args.output),
-            single_line=args.single_line
+            single_line=args.single_line,
+            # Indent JSON for files and terminals; pipe compact JSON to other tools
+            pretty_json=bool(args.output) or sys.stdout.isatty()
         )
         
         # Write to file if specified
@@ -3190,7 +3750,6 @@ def main():
                 script = recommender.generate_voting_script(recommendations, quiet=args.json or args.output)
                 if script:
                     # Always save script to a file
-                    import os
                     script_file = 'blackhole_select_pools.js'
                     if args.output:
                         # Use output filename as base
@@ -3230,7 +3789,6 @@ def main():
         
     except Exception as e:
         logger.error(f"Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
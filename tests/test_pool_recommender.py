@@ -6,8 +6,10 @@ import json
 import pickle
 import io
 import re
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
-from blackhole_pool_recommender import BlackholePoolRecommender, Pool
+from blackhole_pool_recommender import BlackholePoolRecommender, Pool, _parse_number, _HARVEST_POOL_ROWS_JS, _BODY_TEXT_JS
+from blackhole_pool_recommender import _parse_duration, _RE_DURATION_ABBR, _ELEMENT_TEXTS_CONTAINING_JS
 
 
 class TestPool:
@@ -41,6 +43,16 @@ class TestPool:
         assert isinstance(score, float)
         assert score >= 0
     
+    def test_pool_profitability_score_follows_updated_metrics(self):
+        """Test that a memoized score is not reused after a pool's metrics change"""
+        pool = Pool(name='Test Pool', total_rewards=1000.0, vapr=50.0, current_votes=10000.0)
+        before = pool.profitability_score()
+        
+        pool.total_rewards = 4000.0
+        
+        assert pool.profitability_score() > before
+        assert pool.profitability_score() == Pool('Other', 4000.0, 50.0, 10000.0).profitability_score()
+    
     def test_pool_estimate_user_rewards(self):
         """Test user reward estimation"""
         pool = Pool(
@@ -71,6 +83,13 @@ class TestPool:
         # Should return total rewards if no current votes
         assert estimated == 1000.0
 
+    def test_pool_uses_slots(self):
+        """Test that Pool is slotted (no per-instance __dict__) and still pickles"""
+        pool = Pool('Test Pool', 1000.0, 50.0, 10000.0, pool_type='CL200')
+
+        assert not hasattr(pool, '__dict__')
+        assert pickle.loads(pickle.dumps(pool)) == pool
+
 
 class TestPoolRecommender:
     """Tests for BlackholePoolRecommender class"""
@@ -127,6 +146,31 @@ class TestPoolRecommender:
         assert 'pools' in data
         assert len(data['pools']) == 1
     
+    def test_get_json_output_compact(self):
+        """Test compact JSON output has no indentation but the same data"""
+        recommender = BlackholePoolRecommender()
+        pools = [Pool('Test Pool', 1000.0, 50.0, 10000.0)]
+        
+        compact = recommender._get_json_output(pools, pretty=False)
+        pretty = recommender._get_json_output(pools)
+        
+        assert '\n' not in compact
+        assert '\n  "pools"' in pretty
+        assert json.loads(compact)['pools'] == json.loads(pretty)['pools']
+    
+    @pytest.mark.parametrize('pretty', [True, False])
+    def test_get_json_output_keeps_non_ascii_without_orjson(self, pretty):
+        """Test that the stdlib JSON path writes non-ASCII text as-is, like orjson"""
+        import blackhole_pool_recommender as bpr
+        recommender = BlackholePoolRecommender()
+        pools = [Pool('WAVAX/€URC', 1000.0, 50.0, 10000.0)]
+        
+        with patch.object(bpr, 'ORJSON_AVAILABLE', False):
+            output = recommender._get_json_output(pools, pretty=pretty)
+        
+        assert 'WAVAX/€URC' in output
+        assert json.loads(output)['pools'][0]['name'] == 'WAVAX/€URC'
+    
     def test_print_recommendations_return_output(self):
         """Test getting output as string"""
         recommender = BlackholePoolRecommender()
@@ -236,6 +280,22 @@ class TestPoolRecommender:
             # Highest reward pool should be first
             assert recommendations[0].total_rewards >= recommendations[1].total_rewards
     
+    def test_recommend_pools_keeps_fetch_order_for_ties(self):
+        """Test top-N selection keeps equal-scoring pools in fetch order"""
+        recommender = BlackholePoolRecommender()
+        
+        with patch.object(recommender, 'fetch_pools') as mock_fetch:
+            mock_fetch.return_value = [
+                Pool('First Tie', 500.0, 30.0, 8000.0),
+                Pool('Best', 1000.0, 50.0, 5000.0),
+                Pool('Second Tie', 500.0, 30.0, 8000.0),
+                Pool('Worst', 10.0, 1.0, 8000.0)
+            ]
+            
+            recommendations = recommender.recommend_pools(top_n=3, quiet=True)
+            
+            assert [p.name for p in recommendations] == ['Best', 'First Tie', 'Second Tie']
+    
     def test_recommend_pools_with_voting_power(self):
         """Test pool recommendations with voting power"""
         recommender = BlackholePoolRecommender()
@@ -275,6 +335,31 @@ class TestPoolRecommender:
             assert len(recommendations) == 1
             assert recommendations[0].pool_type != 'vAMM'
     
+    def test_recommend_pools_combined_filters_report_per_filter_counts(self, capsys):
+        """Test that each dropped pool is reported once, against the first filter that drops it"""
+        recommender = BlackholePoolRecommender()
+        
+        with patch.object(recommender, 'fetch_pools') as mock_fetch:
+            mock_fetch.return_value = [
+                Pool('vAMM-WAVAX/USDC', 50.0, 50.0, 10000.0, pool_type='vAMM'),
+                Pool('CL200-WAVAX/USDC', 50.0, 75.0, 5000.0, pool_type='CL200'),
+                Pool('CL200-BTC.b/USDC', 2000.0, 80.0, 8000.0, pool_type='CL200'),
+                Pool('CL200-WAVAX/USDT', 3000.0, 90.0, 15000.0, pool_type='CL200')
+            ]
+            
+            recommendations = recommender.recommend_pools(
+                top_n=5,
+                hide_vamm=True,
+                min_rewards=1000.0,
+                pool_name='wavax'
+            )
+        
+        output = capsys.readouterr().out
+        assert [p.name for p in recommendations] == ['CL200-WAVAX/USDT']
+        assert "Filtered out 1 vAMM pool(s)" in output
+        assert "Filtered out 1 pool(s) with total rewards < $1,000.00" in output
+        assert "Filtered out 1 pool(s) that don't match pattern 'wavax'" in output
+    
     def test_recommend_pools_max_pool_percentage(self):
         """Test filtering by maximum pool percentage"""
         recommender = BlackholePoolRecommender()
@@ -566,6 +651,31 @@ class TestCaching:
         assert recommender.no_cache is False
         # cache_enabled depends on config, but should not be forced False
     
+    def test_cache_expiry_override_applies_to_validity_and_cache_info(self, tmp_path):
+        """Test that --cache-ttl is used by both the cache check and --cache-info, and is not saved"""
+        recommender = BlackholePoolRecommender(cache_expiry_minutes=180)
+        recommender.configured_cache_expiry_minutes = 60
+        recommender.cache_enabled = True
+        recommender.cache_dir = tmp_path
+        recommender.cache_file = tmp_path / 'pool_data_cache.pkl'
+        recommender.cache_metadata_file = tmp_path / 'pool_data_cache_metadata.json'
+        recommender.cache_lock_file = tmp_path / 'pool_data_cache.lock'
+        pools = [Pool(f"WAVAX/USDC {i}", 10000.0 + i * 100, 50.0, pool_id=f"0x{i:040x}", pool_type="CL200")
+                 for i in range(60)]
+        recommender._save_to_cache(pools)
+        
+        # Older than the configured 60 minutes, younger than the 180-minute override
+        metadata = json.loads(recommender.cache_metadata_file.read_text())
+        assert metadata['expiry_minutes'] == 60
+        metadata['timestamp'] = (datetime.now(timezone.utc) - timedelta(minutes=90)).isoformat()
+        recommender.cache_metadata_file.write_text(json.dumps(metadata))
+        
+        assert recommender._is_cache_valid() is True
+        cache_info = recommender._get_cache_info()
+        assert cache_info['is_valid'] is True
+        assert cache_info['expiry_minutes'] == 180
+        assert cache_info['expiry_time'] > datetime.now(timezone.utc)
+    
     def test_fetch_pools_skips_cache_when_no_cache_true(self):
         """Test that fetch_pools skips cache when no_cache=True"""
         recommender = BlackholePoolRecommender(no_cache=True)
@@ -768,7 +878,7 @@ class TestCaching:
     
     def test_get_cache_info_with_cache(self):
         """Test _get_cache_info when cache exists with valid content"""
-        recommender = BlackholePoolRecommender()
+        recommender = BlackholePoolRecommender(cache_expiry_minutes=7)
         
         # Create mock cache metadata
         from datetime import datetime, timezone, timedelta
@@ -854,7 +964,7 @@ class TestCaching:
     
     def test_get_cache_info_expired_cache(self):
         """Test _get_cache_info with expired cache (timestamp expired)"""
-        recommender = BlackholePoolRecommender()
+        recommender = BlackholePoolRecommender(cache_expiry_minutes=7)
         
         # Create mock cache metadata with old timestamp (expired)
         from datetime import datetime, timezone, timedelta
@@ -890,7 +1000,7 @@ class TestCaching:
     
     def test_get_cache_info_invalid_content(self):
         """Test _get_cache_info with valid timestamp but invalid content"""
-        recommender = BlackholePoolRecommender()
+        recommender = BlackholePoolRecommender(cache_expiry_minutes=7)
         
         # Create mock cache metadata with recent timestamp (valid)
         from datetime import datetime, timezone, timedelta
@@ -1079,3 +1189,457 @@ class TestVAPRExtraction:
         percentages2 = re.findall(vapr_pattern, text2)
         assert len(percentages2) == 1
         assert float(percentages2[0].replace(',', '')) == 2500.75
+
+    def test_parse_number_strips_currency_and_separators(self):
+        """Test that scraped amounts parse with $, commas and ~ removed"""
+        assert _parse_number('$1,234.56') == 1234.56
+        assert _parse_number('~$80') == 80.0
+        assert _parse_number('6,967') == 6967.0
+        assert _parse_number('1,684.6') == 1684.6
+
+
+class TestHTMLParsing:
+    """Tests for the HTML fallback parser"""
+    
+    @pytest.mark.parametrize('lxml', [True, False])
+    def test_parse_table_rows_keeps_cells_separate(self, lxml):
+        """Test that adjacent table cells are not run together when parsing amounts"""
+        import blackhole_pool_recommender as bpr
+        recommender = BlackholePoolRecommender()
+        html = (
+            "<table>"
+            "<tr><td>WAVAX/USDC</td><td>$1,234.5</td><td>55.5%</td></tr>"
+            "<tr><td>header only</td></tr>"
+            "</table>"
+        )
+        
+        with patch.object(bpr, 'LXML_AVAILABLE', lxml):
+            pools = recommender._parse_pools_from_markup(html)
+        
+        assert len(pools) == 1
+        assert pools[0].name == 'WAVAX/USDC'
+        assert pools[0].total_rewards == 1234.5
+        assert pools[0].vapr == 55.5
+    
+    def test_extract_pools_from_nested_initial_state(self):
+        """Test that a nested window.__INITIAL_STATE__ blob is read in full"""
+        recommender = BlackholePoolRecommender()
+        text = (
+            '<script>window.__INITIAL_STATE__ = {"meta": {"v": "}; {"}, '
+            '"pools": [{"name": "WAVAX/USDC", "totalRewards": 1500, "vapr": 42.5}]};</script>'
+        )
+        
+        pools = recommender._extract_pools_from_text(text)
+        
+        assert len(pools) == 1
+        assert pools[0].name == 'WAVAX/USDC'
+        assert pools[0].total_rewards == 1500.0
+        assert pools[0].vapr == 42.5
+    
+    def test_extract_pools_from_text_lines(self):
+        """Test the line scanner assigns amounts to the most recent pair"""
+        recommender = BlackholePoolRecommender()
+        text = "Header line\nWAVAX/USDC\n$1,234.5 rewards\n55.5% VAPR\nBTC.B/AVAX $200 12%\n"
+        
+        pools = recommender._extract_pools_from_text(text)
+        
+        assert [p.name for p in pools] == ['WAVAX/USDC', 'BTC.B/AVAX']
+        assert pools[0].total_rewards == 1234.5
+        assert pools[0].vapr == 55.5
+        assert pools[1].total_rewards == 200.0
+        assert pools[1].vapr == 12.0
+    
+    def test_parse_pool_cards_when_no_table_rows(self):
+        """Test that pool cards are parsed when the page has no table rows"""
+        recommender = BlackholePoolRecommender()
+        html = (
+            "<nav><div class='menu'>$999 menu</div></nav>"
+            "<div class='pool-card'><span class='pool-name'>WAVAX/USDC</span> $2,500 31.5%</div>"
+        )
+        
+        pools = recommender._parse_pools_from_markup(html)
+        
+        assert len(pools) == 1
+        assert pools[0].name == 'WAVAX/USDC'
+        assert pools[0].total_rewards == 2500.0
+        assert pools[0].vapr == 31.5
+    
+    def test_parse_vote_page_rows_from_markup(self):
+        """Test that liquidity-pool-cell rows in saved HTML go through the row parser"""
+        recommender = BlackholePoolRecommender()
+        slots = ['$1,000,000', 'TVL', '$5,000', 'Fees', '55.5%', '', 'Fees + Incentives $2,500', '31.29M']
+        slot_html = ''.join(f"<div class='voting-pool-cell-slot'>{slot}</div>" for slot in slots)
+        row = (
+            "<div class='liquidity-pool-cell {parity}' data-pool-id='{pool_id}'>"
+            "<div class='liquidity-pool-cell-left'><div class='name'>{name}</div></div>"
+            "<div class='liquidity-pool-cell-right'>{slots}</div>"
+            "</div>"
+        )
+        html = (
+            "<div class='pools-container'>"
+            + row.format(parity='even', pool_id='0x' + 'ab' * 20, name='CL200-WAVAX/USDC', slots=slot_html)
+            + row.format(parity='odd disabled', pool_id='0x' + 'cd' * 20, name='vAMM-BTC.b/USDC', slots=slot_html)
+            + "</div>"
+        )
+        
+        pools = recommender._parse_pools_from_markup(html)
+        
+        assert len(pools) == 1
+        assert pools[0].name == 'CL200-WAVAX/USDC'
+        assert pools[0].pool_id == '0x' + 'ab' * 20
+        assert pools[0].total_rewards == 2500.0
+        assert pools[0].vapr == 55.5
+        assert pools[0].current_votes == 31_290_000
+    
+    def test_parse_vote_page_row_address_from_nested_attribute(self):
+        """Test that a row without data-pool-id takes its address from a descendant attribute"""
+        recommender = BlackholePoolRecommender()
+        address = '0x' + 'ef' * 20
+        html = (
+            "<div class='liquidity-pool-cell even'>"
+            "<div class='liquidity-pool-cell-left'><div class='name'>CL200-WAVAX/USDC</div>"
+            f"<a class='explorer-link' href='https://snowtrace.io/address/{address}'>view</a></div>"
+            "<div class='liquidity-pool-cell-right'>"
+            "<div class='voting-pool-cell-slot'>Fees + Incentives $2,500</div>"
+            "</div></div>"
+        )
+        
+        pools = recommender._parse_pools_from_markup(html)
+        
+        assert len(pools) == 1
+        assert pools[0].pool_id == address
+    
+    def test_extract_pools_from_bare_pools_member(self):
+        """Test that a '"pools": [...]' member outside any object is still parsed"""
+        recommender = BlackholePoolRecommender()
+        text = 'render("pools": [{"pair": "BTC.b/USDC", "total_rewards": 900, "VAPR": 12, "votes": 4000}]);'
+        
+        pools = recommender._extract_pools_from_text(text)
+        
+        assert len(pools) == 1
+        assert pools[0].name == 'BTC.b/USDC'
+        assert pools[0].total_rewards == 900.0
+        assert pools[0].current_votes == 4000.0
+
+
+class TestPoolRowParsing:
+    """Tests for parsing harvested pool rows (no browser needed)"""
+    
+    @staticmethod
+    def _row(**overrides):
+        """Build a harvested row like _HARVEST_POOL_ROWS_JS returns"""
+        row = {
+            'text': 'CL200-WAVAX/USDC\n0.05%\n$1,000,000\n$5,000\n55.5%\n$2,500\n31.29M\n120.5%',
+            'classes': 'liquidity-pool-cell even',
+            'style': '',
+            'opacity': '1',
+            'buttons': [],
+            'name': 'CL200-WAVAX/USDC',
+            'left': 'CL200-WAVAX/USDC\n0.05%',
+            'fee': '0.05%',
+            'pool_id': '0x' + 'ab' * 20,
+            'tooltip_id': None,
+            'slots': ['$1,000,000', 'TVL', '$5,000', 'Fees', '55.5%', '', 'Fees + Incentives $2,500', '31.29M\n120.5%'],
+        }
+        row.update(overrides)
+        return row
+    
+    def test_parse_pool_row(self):
+        """Test that slot values are read into a Pool"""
+        recommender = BlackholePoolRecommender()
+        
+        pool = recommender._parse_pool_row(self._row(), fallback_name='Pool_1')
+        
+        assert pool.name == 'CL200-WAVAX/USDC'
+        assert pool.pool_type == 'CL200'
+        assert pool.fee_percentage == '0.05%'
+        assert pool.pool_id == '0x' + 'ab' * 20
+        assert pool.total_rewards == 2500.0
+        assert pool.vapr == 55.5
+        assert pool.current_votes == 31_290_000
+    
+    def test_parse_pool_row_skips_disabled_and_zero_rewards(self):
+        """Test that non-votable rows and rows showing '--' rewards are skipped"""
+        recommender = BlackholePoolRecommender()
+        not_votable = self._row(buttons=[['no-locks-available', '']])
+        no_rewards = self._row(slots=['$1,000,000', 'TVL', '$5,000', 'Fees', '55.5%', '', 'Fees + Incentives --', '6,967'])
+        
+        assert recommender._parse_pool_row(not_votable, fallback_name='Pool_1') is None
+        assert recommender._parse_pool_row(no_rewards, fallback_name='Pool_1') is None
+    
+    def test_parse_pool_row_falls_back_to_row_text(self):
+        """Test that without slots the second-largest amount and largest plain count are used"""
+        recommender = BlackholePoolRecommender()
+        row = self._row(slots=[], text='CL200-WAVAX/USDC\n$1,000,000\n$2,500\n$2,500\n$40\n6,967 votes\n12,345 votes')
+        
+        pool = recommender._parse_pool_row(row, fallback_name='Pool_1')
+        
+        assert pool.total_rewards == 2500.0
+        assert pool.current_votes == 12345.0
+    
+    @pytest.mark.parametrize('left, text, expected_name, expected_type', [
+        ('CL200-WAVAX/USDC\n0.05%', None, 'CL200-WAVAX/USDC', 'CL200'),
+        ('', '0.05%\nWAVAX/USDC\n$2,500', 'Pool_7', None),
+        ('Stable pool\n0.05%', None, 'Pool_7', None),
+    ])
+    def test_parse_pool_row_without_name_cell(self, left, text, expected_name, expected_type):
+        """Test that an unnamed row takes a token pair from its first line, else the fallback name"""
+        recommender = BlackholePoolRecommender()
+        overrides = {'name': '', 'left': left}
+        if text is not None:
+            overrides['text'] = text
+        
+        pool = recommender._parse_pool_row(self._row(**overrides), fallback_name='Pool_7')
+        
+        assert pool.name == expected_name
+        assert pool.pool_type == expected_type
+    
+    def test_extract_pools_from_elements_uses_one_round_trip(self):
+        """Test that all rows are read with a single execute_script call"""
+        recommender = BlackholePoolRecommender()
+        driver = Mock()
+        driver.execute_script.return_value = [self._row(), self._row(name='', left='', text='no pool data here at all', slots=[])]
+        
+        pools = recommender._extract_pools_from_elements([Mock(), Mock()], driver)
+        
+        assert driver.execute_script.call_count == 1
+        assert [p.name for p in pools] == ['CL200-WAVAX/USDC']
+    
+    def test_extract_pools_from_elements_falls_back_to_dom_snapshot(self):
+        """Test that a failing harvest script falls back to parsing the rows' HTML"""
+        recommender = BlackholePoolRecommender()
+        slots = ['$1,000,000', 'TVL', '$5,000', 'Fees', '55.5%', '', 'Fees + Incentives $2,500', '31.29M']
+        html = (
+            "<div class='liquidity-pool-cell even'>"
+            "<div class='liquidity-pool-cell-left'><div class='name'>CL200-WAVAX/USDC</div></div>"
+            "<div class='liquidity-pool-cell-right'>"
+            + ''.join(f"<div class='voting-pool-cell-slot'>{slot}</div>" for slot in slots)
+            + "</div></div>"
+        )
+        driver = Mock()
+        driver.execute_script.side_effect = [Exception("javascript error"), html]
+        
+        pools = recommender._extract_pools_from_elements([Mock()], driver)
+        
+        assert driver.execute_script.call_count == 2
+        assert [p.name for p in pools] == ['CL200-WAVAX/USDC']
+        assert pools[0].total_rewards == 2500.0
+    
+    def test_extract_pools_from_elements_without_elements_reads_page(self):
+        """Test that elements=None harvests the page's rows without passing WebElements"""
+        recommender = BlackholePoolRecommender()
+        driver = Mock()
+        driver.execute_script.return_value = [self._row()]
+        
+        pools = recommender._extract_pools_from_elements(None, driver)
+        
+        driver.execute_script.assert_called_once_with(_HARVEST_POOL_ROWS_JS, None)
+        driver.find_elements.assert_not_called()
+        assert len(pools) == 1
+
+
+class TestNetworkLogExtraction:
+    """Tests for reading pool data from captured network responses"""
+    
+    @staticmethod
+    def _log_entry(request_id, url, mime_type='application/json'):
+        """Build a performance log entry for a Network.responseReceived event"""
+        message = {'message': {
+            'method': 'Network.responseReceived',
+            'params': {'requestId': request_id, 'response': {'url': url, 'mimeType': mime_type}},
+        }}
+        return {'message': json.dumps(message)}
+    
+    def test_extract_from_network_logs_reads_voting_json(self):
+        """Test that a JSON response with voting data becomes pools"""
+        recommender = BlackholePoolRecommender()
+        driver = Mock()
+        driver.get_log.return_value = [
+            self._log_entry('1', 'https://blackhole.xyz/logo.png', mime_type='image/png'),
+            self._log_entry('2', 'https://api.example/cl-pools.json'),
+            self._log_entry('3', 'https://api.example/votes.json'),
+        ]
+        bodies = {
+            '2': {'pools': [{'token0': {'symbol': 'WAVAX'}, 'token1': {'symbol': 'USDC'}, 'fee': '500', 'feesUSD': '100'}]},
+            '3': [{'name': 'WAVAX/USDC', 'totalRewards': 2500, 'vapr': 55.5, 'votes': 6967}],
+        }
+        driver.execute_cdp_cmd.side_effect = lambda cmd, params: {
+            'body': json.dumps(bodies[params['requestId']]), 'base64Encoded': False
+        }
+        
+        pools = recommender._extract_from_network_logs(driver)
+        
+        assert [p.name for p in pools] == ['WAVAX/USDC']
+        assert pools[0].total_rewards == 2500.0
+        assert pools[0].current_votes == 6967.0
+    
+    def test_extract_from_network_logs_without_performance_log(self):
+        """Test that a driver without performance logging yields no pools"""
+        recommender = BlackholePoolRecommender()
+        driver = Mock()
+        driver.get_log.side_effect = Exception("log type 'performance' not found")
+        
+        assert recommender._extract_from_network_logs(driver) == []
+    
+    def test_parse_api_response_maps_fee_tiers(self):
+        """Test that CL pool fee tiers map to pool types and fee labels, with a default for unknown tiers"""
+        recommender = BlackholePoolRecommender()
+        data = {'pools': [
+            {'token0': {'symbol': 'WAVAX'}, 'token1': {'symbol': 'USDC'}, 'fee': fee, 'feesUSD': '100'}
+            for fee in ('100', '2500', '3000')
+        ]}
+        
+        pools = recommender._parse_api_response(data)
+        
+        assert [(p.pool_type, p.fee_percentage) for p in pools] == [
+            ('CL1', '0.01%'), ('CL200', '0.25%'), ('CL200', '0.3%')
+        ]
+
+
+class TestSharedDriver:
+    """Tests for reusing one scraping browser across fetches"""
+    
+    def teardown_method(self):
+        BlackholePoolRecommender._shared_driver = None
+        BlackholePoolRecommender._shared_driver_key = None
+    
+    def test_get_scrape_driver_reuses_browser(self):
+        """Test that a second fetch with the same options reuses the running browser"""
+        first, second = BlackholePoolRecommender(), BlackholePoolRecommender()
+        
+        with patch.object(BlackholePoolRecommender, '_create_scrape_driver', return_value=Mock()) as mock_create, \
+                patch('blackhole_pool_recommender.atexit.register'):
+            assert first._get_scrape_driver() is second._get_scrape_driver()
+            assert mock_create.call_count == 1
+    
+    def test_get_scrape_driver_replaces_browser_for_other_options(self):
+        """Test that changing headless mode launches a new browser and quits the old one"""
+        headless, visible = BlackholePoolRecommender(headless=True), BlackholePoolRecommender(headless=False)
+        old_driver, new_driver = Mock(), Mock()
+        
+        with patch.object(BlackholePoolRecommender, '_create_scrape_driver', side_effect=[old_driver, new_driver]), \
+                patch('blackhole_pool_recommender.atexit.register'):
+            headless._get_scrape_driver()
+            assert visible._get_scrape_driver() is new_driver
+            old_driver.quit.assert_called_once()
+
+
+class TestPageWaits:
+    """Tests for waiting on lazy-loaded pool rows"""
+    
+    def test_scroll_and_wait_for_rows_uses_page_observer(self):
+        """Test that the row count comes back from one async script call"""
+        recommender = BlackholePoolRecommender()
+        driver = Mock()
+        driver.execute_async_script.return_value = 120
+        
+        assert recommender._scroll_and_wait_for_rows(driver, None, 100) == 120
+        driver.execute_script.assert_not_called()
+    
+    def test_scroll_and_wait_for_rows_falls_back_to_polling(self):
+        """Test that a failing async script falls back to scrolling and polling the count"""
+        recommender = BlackholePoolRecommender()
+        driver = Mock()
+        driver.execute_async_script.side_effect = Exception("script timeout")
+        driver.execute_script.return_value = 150
+        
+        assert recommender._scroll_and_wait_for_rows(driver, None, 100, first_wait=0.5) == 150
+
+
+class TestEpochInfo:
+    """Tests for reading the epoch close time from the vote page"""
+    
+    @staticmethod
+    def _driver(body_text):
+        """Build a driver whose page has only a body with the given text"""
+        driver = Mock()
+        driver.find_elements.return_value = []
+        driver.execute_script.side_effect = lambda script, *args: body_text if script == _BODY_TEXT_JS else None
+        return driver
+    
+    def test_extract_epoch_info_from_deadline_countdown(self):
+        """Test that 'Voting deadline for epoch #N' followed by a countdown sets the close time"""
+        recommender = BlackholePoolRecommender()
+        driver = self._driver("Vote\nVoting deadline for epoch #42: 2 days 3 hours\nPools")
+        
+        before = datetime.now(timezone.utc)
+        recommender._extract_epoch_info(driver, quiet=True)
+        
+        expected = before + timedelta(days=2, hours=3)
+        assert abs((recommender.epoch_close_utc - expected).total_seconds()) < 5
+    
+    def test_extract_epoch_info_reads_countdown_next_to_deadline_label(self):
+        """Test that a countdown outside the label's text line is read from the label's parent"""
+        recommender = BlackholePoolRecommender()
+        scripts = {
+            _BODY_TEXT_JS: "Voting deadline for epoch #42",
+            _ELEMENT_TEXTS_CONTAINING_JS: ["Voting deadline for epoch #42\n1 day 2 hours"],
+        }
+        driver = Mock()
+        driver.find_elements.return_value = []
+        driver.execute_script.side_effect = lambda script, *args: scripts.get(script)
+        
+        before = datetime.now(timezone.utc)
+        recommender._extract_epoch_info(driver, quiet=True)
+        
+        expected = before + timedelta(days=1, hours=2)
+        assert abs((recommender.epoch_close_utc - expected).total_seconds()) < 5
+        assert driver.execute_script.call_args_list[-1].args[1:] == (['voting deadline', 'deadline for epoch'], True)
+    
+    def test_parse_duration_reads_every_unit_in_one_pass(self):
+        """Test that spelled-out and abbreviated countdowns are summed per unit"""
+        assert _parse_duration("2 days 3 hours 4 minutes 5 seconds") == timedelta(days=2, hours=3, minutes=4, seconds=5)
+        assert _parse_duration("1 Day 12 Hours, then 9 days") == timedelta(days=1, hours=12)
+        assert _parse_duration("02d 08h 38m 35s", _RE_DURATION_ABBR) == timedelta(days=2, hours=8, minutes=38, seconds=35)
+        assert _parse_duration("no countdown here") == timedelta(0)
+    
+    def test_get_page_text_reuses_text_for_same_url(self):
+        """Test that a second lookup on the same page does not read the page again"""
+        recommender = BlackholePoolRecommender()
+        driver = self._driver("Voting deadline for epoch #42: 2 days 3 hours")
+        driver.current_url = 'https://blackhole.xyz/vote'
+        
+        first = recommender._get_page_text(driver)
+        second = recommender._get_page_text(driver)
+        
+        assert first == second
+        assert driver.execute_script.call_count == 1
+    
+    def test_extract_epoch_info_from_utc_timestamp(self):
+        """Test the fallback to a future UTC timestamp when there is no countdown"""
+        recommender = BlackholePoolRecommender()
+        close = (datetime.now(timezone.utc) + timedelta(days=3)).replace(microsecond=0)
+        driver = self._driver(f"Epoch deadline\nCloses {close.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+        
+        recommender._extract_epoch_info(driver, quiet=True)
+        
+        assert recommender.epoch_close_utc == close
+    
+    def test_extract_epoch_info_skips_deadline_and_utc_scans_without_keywords(self):
+        """Test that a page without 'deadline' or 'UTC' goes straight to the countdown fallback"""
+        import blackhole_pool_recommender as bpr
+        recommender = BlackholePoolRecommender()
+        driver = self._driver("Epoch ends in 1 day, 6 hours")
+        
+        with patch.object(bpr, '_RE_DEADLINE_PATTERNS', (Mock(),)) as patterns, \
+                patch.object(bpr, '_RE_UTC_DATE') as utc_date:
+            before = datetime.now(timezone.utc)
+            recommender._extract_epoch_info(driver, quiet=True)
+        
+        patterns[0].search.assert_not_called()
+        utc_date.findall.assert_not_called()
+        expected = before + timedelta(days=1, hours=6)
+        assert abs((recommender.epoch_close_utc - expected).total_seconds()) < 5
+    
+    @pytest.mark.parametrize('lxml, bs4', [(True, True), (False, True), (False, False)])
+    def test_html_to_text_drops_scripts_and_separates_blocks(self, lxml, bs4):
+        """Test that every page-source text backend skips script/style and keeps lines apart"""
+        import blackhole_pool_recommender as bpr
+        html = ("<html><head><style>p{}</style><script>var deadline=1;</script></head>"
+                "<body><div>Voting deadline</div><div>for epoch #42</div><p>2 days</p></body></html>")
+        
+        with patch.object(bpr, 'LXML_AVAILABLE', lxml), patch.object(bpr, 'BS4_AVAILABLE', bs4):
+            text = bpr._html_to_text(html)
+        
+        lines = [line for line in text.split('\n') if line.strip()]
+        assert lines == ['Voting deadline', 'for epoch #42', '2 days']